@@ -0,0 +1,222 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from parallel_agg import aggregate
+
+# --- Grouping keys ---
+STATE = "State Name"
+DISTRICT = "Dist Name"
+YEAR = "Year"
+
+# Crop measure columns end with one of these units
+MEASURE_SUFFIXES = ("(1000 ha)", "(1000 tons)", "(Kg per ha)")
+YIELD_SUFFIX = " YIELD (Kg per ha)"
+
+
+def measure_columns(df):
+    return [col for col in df.columns if col.endswith(MEASURE_SUFFIXES)]
+
+
+# --- Area-weighted yields ---
+# A yield can't be summed: above the district-year grain it is the summed
+# production over the summed area. Every rollup carries both sums, so yields
+# are re-derived from them instead of read from the raw rows.
+def yield_inputs(column):
+    # (production, area) columns a yield column is derived from
+    crop = column[:-len(YIELD_SUFFIX)]
+    return f"{crop} PRODUCTION (1000 tons)", f"{crop} AREA (1000 ha)"
+
+
+def with_yield_inputs(columns):
+    # `columns` plus the production and area columns behind the yields among them
+    out = list(columns)
+    for col in columns:
+        if col.endswith(YIELD_SUFFIX):
+            out += [part for part in yield_inputs(col) if part not in out]
+    return out
+
+
+def weighted_yields(totals):
+    # Overwrite the yield columns of summed rows with production / area in
+    # kg/ha, all crops in one array division. Groups without area get NaN.
+    cols = [col for col in totals.columns
+            if col.endswith(YIELD_SUFFIX) and set(yield_inputs(col)) <= set(totals.columns)]
+    if cols:
+        production, area = (list(parts) for parts in zip(*map(yield_inputs, cols)))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = totals[production].to_numpy("float64") * 1000 / totals[area].to_numpy("float64")
+        values[~np.isfinite(values)] = np.nan
+        totals[cols] = values
+    return totals
+
+
+def rollup(frame, level, columns=None):
+    # Sums of `frame` per index level(s) with area-weighted yields; a single
+    # column name gives a Series, a list a DataFrame (like frame[columns])
+    if columns is None:
+        return weighted_yields(frame.groupby(level=level).sum())
+    cols = [columns] if isinstance(columns, str) else list(columns)
+    return weighted_yields(frame.groupby(level=level)[with_yield_inputs(cols)].sum())[columns]
+
+
+class AggregateCube:
+    # State x year and district x year rollups of every crop measure column.
+    # Built once per data version; charts slice it instead of scanning raw rows.
+
+    def __init__(self, district_year, state_year):
+        self.district_year = district_year
+        self.state_year = state_year
+
+    @classmethod
+    def build(cls, df):
+        columns = measure_columns(df)
+        # The one pass over raw rows; split by state across processes when large
+        district_year = aggregate(df, [STATE, DISTRICT, YEAR], columns, by=STATE)
+
+        # Plain string labels so charts and downloads don't carry category dtypes
+        district_year = district_year.reset_index()
+        district_year[STATE] = district_year[STATE].astype(str)
+        district_year[DISTRICT] = district_year[DISTRICT].astype(str)
+        district_year = district_year.set_index([STATE, DISTRICT, YEAR]).sort_index()
+
+        # State rollup is derived from the (much smaller) district rollup.
+        # District-year rows keep the source yields (one record per row).
+        state_year = rollup(district_year, [STATE, YEAR])
+        return cls(district_year, state_year)
+
+    # --- Memory-mapped storage ---
+    def save(self, path):
+        # Both rollups as uncompressed, single-batch Arrow IPC files that open() can map
+        os.makedirs(path, exist_ok=True)
+        for name, frame in [("district_year", self.district_year), ("state_year", self.state_year)]:
+            table = frame.reset_index()
+            for key in (STATE, DISTRICT):
+                if key in table:
+                    table[key] = table[key].astype("category")
+            feather.write_feather(table, os.path.join(path, f"{name}.arrow"),
+                                  compression="uncompressed", chunksize=max(len(table), 1))
+
+    @classmethod
+    def open(cls, path):
+        # Read-only cube whose measure columns point into the mapped files, so
+        # every session (and every process opening the same files) shares one copy
+        return cls(mapped_frame(os.path.join(path, "district_year.arrow")),
+                   mapped_frame(os.path.join(path, "state_year.arrow")))
+
+    def filter(self, filters):
+        # Cube restricted to the states/districts/years of a filters.Filters.
+        # Rows are picked through the index codes, never by comparing strings.
+        if not (filters.states or filters.districts or filters.years):
+            return self
+        index = self.district_year.index
+        mask = np.ones(len(index), dtype=bool)
+        if filters.states:
+            mask &= level_mask(index, STATE, lambda labels: labels.isin(filters.states))
+        if filters.districts:
+            mask &= district_mask(index, filters.districts)
+        if filters.years:
+            lo, hi = filters.years
+            mask &= level_mask(index, YEAR, lambda labels: (labels >= lo) & (labels <= hi))
+        district_year = self.district_year[mask]
+        return AggregateCube(district_year, rollup(district_year, [STATE, YEAR]))
+
+    # --- Slices used by the charts ---
+    # Every backend (see backends.py) answers these same calls. Totals of a
+    # yield column are area-weighted (see rollup()).
+    def state_totals(self, columns):
+        # Totals per state over all years
+        return rollup(self.state_year, STATE, columns)
+
+    def year_totals(self, columns, state=None):
+        # Totals per year, for all of India or a single state
+        frame = self.state_year
+        if state is not None:
+            frame = state_rows(frame, state)
+        return rollup(frame, YEAR, columns)
+
+    def district_totals(self, columns, state):
+        # Totals per district of one state over all years
+        frame = state_rows(self.district_year, state)
+        return rollup(frame, DISTRICT, columns)
+
+    def state_year_rows(self, columns):
+        # One row per state and year
+        return self.state_year[columns]
+
+    def district_rows(self, columns):
+        # One row per district and year (the grain of the source data)
+        return self.district_year[columns]
+
+    def correlation(self, x, y):
+        # Pearson r between two columns at district-year grain
+        return self.district_year[x].corr(self.district_year[y])
+
+    def memory_usage(self):
+        # Bytes held by both rollups
+        return sum(int(frame.memory_usage(deep=True).sum()) for frame in (self.district_year, self.state_year))
+
+    def districts(self):
+        # (state, district) pairs in the data, for the filter widgets
+        return self.district_year.index.droplevel(YEAR).unique().to_frame(index=False)
+
+    def years(self):
+        # First and last year in the data
+        years = self.district_year.index.get_level_values(YEAR)
+        return (int(years.min()), int(years.max())) if len(years) else None
+
+
+def mapped_frame(path):
+    # DataFrame over a memory-mapped Arrow file, indexed by its key columns
+    table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+    keys = [key for key in (STATE, DISTRICT, YEAR) if key in table.column_names]
+    levels, codes = zip(*(key_level(table.column(key).to_pandas()) for key in keys))
+    index = pd.MultiIndex(levels=levels, codes=codes, names=keys, verify_integrity=False)
+    columns = {name: column_values(table.column(name)) for name in table.column_names if name not in keys}
+    return pd.DataFrame(columns, index=index, copy=False)
+
+
+def key_level(values):
+    # (labels, codes) of one index level; names are stored as dictionaries
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.categories.astype(str), values.cat.codes.to_numpy()
+    codes, labels = pd.factorize(values, sort=True)
+    return labels, codes
+
+
+def column_values(column):
+    # Zero-copy (read-only) view of a numeric column; copied only if it has nulls or several chunks
+    if column.num_chunks == 1 and column.null_count == 0:
+        return column.chunk(0).to_numpy(zero_copy_only=True)
+    return column.to_numpy()
+
+
+def level_mask(index, level, select):
+    # Boolean row mask from a test on the (few) distinct labels of one index level
+    pos = index.names.index(level)
+    return np.asarray(select(index.levels[pos]))[index.codes[pos]]
+
+
+def district_mask(index, pairs):
+    # Boolean row mask of the given (state, district) pairs, matched on the
+    # codes of both levels: district names repeat across states
+    states = index.levels[index.names.index(STATE)]
+    districts = index.levels[index.names.index(DISTRICT)]
+    state_codes = states.get_indexer([state for state, _ in pairs])
+    district_codes = districts.get_indexer([district for _, district in pairs])
+    found = (state_codes >= 0) & (district_codes >= 0)
+    wanted = state_codes[found].astype("int64") * len(districts) + district_codes[found]
+    rows = (index.codes[index.names.index(STATE)].astype("int64") * len(districts)
+            + index.codes[index.names.index(DISTRICT)])
+    return np.isin(rows, wanted)
+
+
+def state_rows(frame, state):
+    # Rows of a single state (empty if the state is not in the data)
+    try:
+        return frame.xs(state, level=STATE, drop_level=False)
+    except KeyError:
+        return frame.iloc[0:0]
@@ -0,0 +1,134 @@
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from aggregates import AggregateCube, YEAR
+
+# Rolling window (rolling mean, volatility) and CAGR span, in reported years
+WINDOW = 5
+SPAN = 10
+
+LEVELS = ["national", "state", "district"]
+METRICS = ["value", "yoy", "cagr", "rolling_mean", "volatility"]
+
+
+def growth(frame, window=WINDOW, span=SPAN):
+    # YoY growth, CAGR over `span` years, rolling mean and volatility (rolling
+    # std of YoY) over `window` years for every column of a frame indexed by
+    # (*keys, Year). All groups are handled in one pass over the sorted rows:
+    # lags are row shifts masked at group starts, rolling sums are differences
+    # of a running cumulative sum. Returns {metric: frame like `frame`}.
+    frame = frame.sort_index()
+    n = len(frame)
+    keys = [name for name in frame.index.names if name != YEAR]
+    years = frame.index.get_level_values(YEAR).to_numpy(dtype="float64")
+    values = frame.to_numpy(dtype="float64")
+
+    # Position of each row inside its group (rows of a group are contiguous)
+    if keys and n:
+        group = frame.groupby(level=keys, sort=False).ngroup().to_numpy()
+        starts = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+    else:
+        starts = np.array([0])
+    position = np.arange(n) - np.repeat(starts, np.diff(np.r_[starts, n]))
+
+    def lag(arr, k):
+        out = np.full(arr.shape, np.nan)
+        if k < n:
+            out[k:] = arr[:n - k]
+        out[position < k] = np.nan
+        return out
+
+    def rolling_sum(arr):
+        # Sum of the last `window` rows of the group (NaN until the window is full)
+        cum = np.cumsum(arr, axis=0)
+        out = cum.copy()
+        out[window:] -= cum[:-window]
+        out[position < window - 1] = np.nan
+        return out
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        previous = lag(values, 1)
+        consecutive = (years - lag(years, 1) == 1)[:, None]
+        yoy = np.where(consecutive & (previous > 0), values / previous - 1, np.nan)
+
+        base = lag(values, span)
+        elapsed = (years - lag(years, span))[:, None]
+        cagr = np.where(base > 0, (values / base) ** (1 / elapsed) - 1, np.nan)
+
+        rolling_mean = rolling_sum(np.nan_to_num(values)) / window
+
+        # Rolling std of the YoY rates that are defined inside the window
+        valid = ~np.isnan(yoy)
+        count = rolling_sum(valid.astype("float64"))
+        total = rolling_sum(np.where(valid, yoy, 0))
+        squares = rolling_sum(np.where(valid, yoy ** 2, 0))
+        variance = (squares - total ** 2 / count) / (count - 1)
+        volatility = np.where(count >= 2, np.sqrt(np.clip(variance, 0, None)), np.nan)
+
+    results = {"value": values, "yoy": yoy, "cagr": cagr, "rolling_mean": rolling_mean, "volatility": volatility}
+    return {name: pd.DataFrame(data, index=frame.index, columns=frame.columns) for name, data in results.items()}
+
+
+def level_frame(source, level, columns):
+    # Yearly totals at one level from any backend answering the AggregateCube calls
+    if level == "national":
+        return source.year_totals(columns)
+    if level == "state":
+        return source.state_year_rows(columns)
+    if level == "district":
+        return source.district_rows(columns)
+    raise ValueError(f"Unknown level: {level}")
+
+
+def growth_table(source, level, columns, window=WINDOW, span=SPAN):
+    # Long table (keys, Year, Measure, value and growth metrics) at one level
+    metrics = growth(level_frame(source, level, list(columns)), window, span)
+    table = pd.concat({name: metrics[name].stack() for name in METRICS}, axis=1)
+    table.index = table.index.set_names("Measure", level=-1)
+    table = table.reset_index()
+    table.insert(0, "Level", level)
+    return table
+
+
+def with_growth(frame, window=WINDOW, span=SPAN):
+    # National yearly totals (indexed by Year) with growth columns after each measure
+    metrics = growth(frame, window, span)
+    labels = {
+        "yoy": "YoY %",
+        "cagr": f"CAGR {span}y %",
+        "rolling_mean": f"{window}y avg",
+        "volatility": f"{window}y volatility %",
+    }
+    out = frame.copy()
+    for col in frame.columns:
+        for name, label in labels.items():
+            scale = 100 if label.endswith("%") else 1
+            out[f"{col} {label}"] = metrics[name][col] * scale
+    return out
+
+
+def growth_columns(columns, window=WINDOW):
+    # Names with_growth() gives the rolling mean and YoY of `columns`
+    return [f"{col} {window}y avg" for col in columns], [f"{col} YoY %" for col in columns]
+
+
+if __name__ == "__main__":
+    from data_store import CSV_PATH, PARQUET_PATH, load_columns
+
+    parser = argparse.ArgumentParser(description="Write the YoY/CAGR/rolling growth table of every crop")
+    parser.add_argument("--level", choices=LEVELS, nargs="+", default=LEVELS)
+    parser.add_argument("--csv", default=CSV_PATH)
+    parser.add_argument("--parquet", default=PARQUET_PATH)
+    parser.add_argument("--out", default="agri_growth.parquet", help=".parquet or .csv")
+    args = parser.parse_args()
+
+    cube = AggregateCube.build(load_columns(None, args.csv, args.parquet))
+    production = [col for col in cube.district_year.columns if col.endswith("PRODUCTION (1000 tons)")]
+    table = pd.concat([growth_table(cube, level, production) for level in args.level], ignore_index=True)
+    if args.out.endswith(".csv"):
+        table.to_csv(args.out, index=False)
+    else:
+        table.to_parquet(args.out, index=False)
+    print(f"Wrote {len(table):,} rows ({', '.join(args.level)}) to {args.out}")
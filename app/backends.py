@@ -0,0 +1,205 @@
+import copy
+import os
+import re
+
+import pandas as pd
+from sqlalchemy import inspect, text
+
+from aggregates import MEASURE_SUFFIXES, STATE, DISTRICT, YEAR, YIELD_SUFFIX, yield_inputs
+
+# Data sources the dashboard can aggregate from
+BACKENDS = ["csv", "postgres", "duckdb"]
+DEFAULT_BACKEND = os.environ.get("AGRI_BACKEND", "csv")
+
+TABLE = "agri_data"
+WATERMARK_TABLE = "etl_watermark"
+
+# Materialized rollups maintained by python_script/agri_etl_postgres.py
+STATE_YEAR_VIEW = "agri_state_year"
+DISTRICT_YEAR_VIEW = "agri_district_year"
+
+# Embedded DuckDB settings; unset leaves DuckDB's defaults (all cores, 80% of
+# RAM, spilling next to the process) in place
+DUCKDB_SETTINGS = {
+    "threads": os.environ.get("AGRI_DUCKDB_THREADS"),
+    "memory_limit": os.environ.get("AGRI_DUCKDB_MEMORY_LIMIT"),
+    "temp_directory": os.environ.get("AGRI_DUCKDB_TEMP_DIR"),
+}
+
+
+def quote(name):
+    # Column names contain spaces and brackets, so always quote them
+    return '"' + name.replace('"', '""') + '"'
+
+
+def total(col):
+    # SQL total of a measure; yields are area-weighted (summed production over summed area, kg/ha)
+    if col.endswith(YIELD_SUFFIX):
+        production, area = yield_inputs(col)
+        return f"SUM({quote(production)}) * 1000.0 / NULLIF(SUM({quote(area)}), 0)"
+    return f"SUM({quote(col)})"
+
+
+class SqlBackend:
+    # Answers the same calls as AggregateCube with GROUP BY queries run in
+    # PostgreSQL, so only the aggregated rows travel over the wire.
+
+    def __init__(self, engine, table=TABLE):
+        self.engine = engine
+        self.table = table
+
+        # Read from the ETL's materialized rollups when they exist
+        with engine.connect() as conn:
+            views = set(conn.execute(text(
+                "SELECT matviewname FROM pg_matviews WHERE schemaname = current_schema()")).scalars())
+        self.state_year = STATE_YEAR_VIEW if STATE_YEAR_VIEW in views else table
+        self.district_year = DISTRICT_YEAR_VIEW if DISTRICT_YEAR_VIEW in views else table
+
+        # WHERE clauses and bind parameters added by filter()
+        self.conditions = []
+        self.params = {}
+
+    def filter(self, filters):
+        # Same backend with a filters.Filters slice added to every query
+        if not (filters.states or filters.districts or filters.years):
+            return self
+        backend = copy.copy(self)
+        backend.conditions, backend.params = list(self.conditions), dict(self.params)
+        if filters.states:
+            backend.conditions.append(f"{quote(STATE)} = ANY(:states)")
+            backend.params["states"] = list(filters.states)
+        if filters.districts:
+            # District slices can't use the state-year rollup
+            backend.state_year = backend.district_year
+            # Matched as (state, district) pairs: district names repeat across states
+            pairs = []
+            for i, (state, district) in enumerate(filters.districts):
+                pairs.append(f"(:district_state_{i}, :district_{i})")
+                backend.params[f"district_state_{i}"], backend.params[f"district_{i}"] = state, district
+            backend.conditions.append(f"({quote(STATE)}, {quote(DISTRICT)}) IN ({', '.join(pairs)})")
+        if filters.years:
+            backend.conditions.append(f"{quote(YEAR)} BETWEEN :year_from AND :year_to")
+            backend.params["year_from"], backend.params["year_to"] = filters.years
+        return backend
+
+    def _where(self, *conditions):
+        conditions = self.conditions + list(conditions)
+        return f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    def _read(self, sql, params=None):
+        params = {**self.params, **(params or {})}
+        with self.engine.connect() as conn:
+            return pd.read_sql(text(sql), conn, params=params or None)
+
+    def _one(self, sql):
+        # First row of a query, as a tuple
+        with self.engine.connect() as conn:
+            return tuple(conn.execute(text(sql), self.params).one())
+
+    def _grouped(self, group, columns, state=None):
+        source = self.district_year if group == DISTRICT else self.state_year
+        cols = [columns] if isinstance(columns, str) else list(columns)
+        sums = ", ".join(f"{total(col)} AS {quote(col)}" for col in cols)
+        where = self._where(*([f"{quote(STATE)} = :state"] if state is not None else []))
+        sql = (f"SELECT {quote(group)}, {sums} FROM {quote(source)} {where} "
+               f"GROUP BY {quote(group)} ORDER BY {quote(group)}")
+        params = {"state": state} if state is not None else None
+        # A single column name gives a Series, a list a DataFrame (like frame[columns])
+        return self._read(sql, params).set_index(group)[columns]
+
+    # --- Slices used by the charts ---
+    def state_totals(self, columns):
+        return self._grouped(STATE, columns)
+
+    def year_totals(self, columns, state=None):
+        return self._grouped(YEAR, columns, state)
+
+    def district_totals(self, columns, state):
+        return self._grouped(DISTRICT, columns, state)
+
+    def state_year_rows(self, columns):
+        cols = [columns] if isinstance(columns, str) else list(columns)
+        keys = f"{quote(STATE)}, {quote(YEAR)}"
+        sums = ", ".join(f"{total(col)} AS {quote(col)}" for col in cols)
+        sql = f"SELECT {keys}, {sums} FROM {quote(self.state_year)} {self._where()} GROUP BY {keys} ORDER BY {keys}"
+        return self._read(sql).set_index([STATE, YEAR])[columns]
+
+    def district_rows(self, columns):
+        cols = [columns] if isinstance(columns, str) else list(columns)
+        keys = [STATE, DISTRICT, YEAR]
+        select = ", ".join(quote(col) for col in keys + cols)
+        sql = f"SELECT {select} FROM {quote(self.district_year)} {self._where()}"
+        return self._read(sql).set_index(keys)[columns]
+
+    def correlation(self, x, y):
+        sql = f"SELECT corr({quote(x)}, {quote(y)}) FROM {quote(self.district_year)} {self._where()}"
+        return self._one(sql)[0]
+
+    def districts(self):
+        keys = f"{quote(STATE)}, {quote(DISTRICT)}"
+        return self._read(f"SELECT DISTINCT {keys} FROM {quote(self.district_year)} {self._where()} ORDER BY {keys}")
+
+    def years(self):
+        sql = f"SELECT MIN({quote(YEAR)}), MAX({quote(YEAR)}) FROM {quote(self.district_year)} {self._where()}"
+        first, last = self._one(sql)
+        return (int(first), int(last)) if first is not None else None
+
+
+class DuckDbBackend(SqlBackend):
+    # The same SQL as SqlBackend, run by an embedded DuckDB over the CSV or
+    # Parquet file: no server, multi-threaded vectorized scans, and queries
+    # that spill to disk instead of needing the data to fit in memory.
+
+    def __init__(self, path, columns=None):
+        import duckdb  # optional, only needed by this backend
+
+        self.conn = duckdb.connect(config={k: v for k, v in DUCKDB_SETTINGS.items() if v})
+        select = ", ".join(quote(col) for col in columns) if columns else "*"
+        if path.endswith(".parquet"):
+            # Scanned in place; only the columns a query names are read
+            self.conn.execute(f"CREATE VIEW {TABLE} AS SELECT {select} FROM read_parquet({literal(path)})")
+        else:
+            # Parsed once into DuckDB's compressed columnar storage
+            self.conn.execute(f"CREATE TABLE {TABLE} AS SELECT {select} FROM read_csv_auto({literal(path)})")
+
+        # State-year rollup built in one scan, like the ETL's materialized view;
+        # district-year is the grain of the source, so it is the table itself
+        names = [row[0] for row in self.conn.execute(f"DESCRIBE {TABLE}").fetchall()]
+        keys = f"{quote(STATE)}, {quote(YEAR)}"
+        sums = ", ".join(f"{total(col)} AS {quote(col)}" for col in names if col.endswith(MEASURE_SUFFIXES))
+        self.conn.execute(f"CREATE TABLE {STATE_YEAR_VIEW} AS SELECT {keys}, {sums} FROM {TABLE} GROUP BY {keys}")
+
+        self.table = TABLE
+        self.state_year = STATE_YEAR_VIEW
+        self.district_year = TABLE
+        self.conditions = []
+        self.params = {}
+
+    def _execute(self, cursor, sql, params):
+        # DuckDB names its parameters $name instead of :name
+        return cursor.execute(re.sub(r":(\w+)", r"$\1", sql), params)
+
+    def _read(self, sql, params=None):
+        # A cursor per query: sessions query the shared database concurrently
+        with self.conn.cursor() as cursor:
+            return self._execute(cursor, sql, {**self.params, **(params or {})}).df()
+
+    def _one(self, sql):
+        with self.conn.cursor() as cursor:
+            return self._execute(cursor, sql, self.params).fetchone()
+
+
+def literal(value):
+    # SQL string literal (file paths)
+    return "'" + value.replace("'", "''") + "'"
+
+
+def sql_version(engine, table=TABLE):
+    # Last ETL load from the watermark table, if the ETL wrote one
+    if not inspect(engine).has_table(WATERMARK_TABLE):
+        return "postgres"
+    with engine.connect() as conn:
+        loaded_at = conn.execute(
+            text(f"SELECT loaded_at FROM {WATERMARK_TABLE} WHERE table_name = :t"),
+            {"t": table}).scalar()
+    return f"postgres:{loaded_at}"
@@ -0,0 +1,72 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import plotly.io as pio
+
+from profiling import stage
+
+
+class ChartCache:
+    # LRU cache with a time-to-live, shared by every session of the process
+
+    def __init__(self, max_entries=64, ttl=3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Process-wide instance
+chart_cache = ChartCache(
+    max_entries=int(os.environ.get("AGRI_CHART_CACHE_SIZE", "64")),
+    ttl=float(os.environ.get("AGRI_CHART_CACHE_TTL", "3600")),
+)
+
+
+def memoize_chart(chart_id, version, build, params=None):
+    # Returns (frame, *figures) for a chart, building them only on a cache miss.
+    # Figures are kept as JSON so cached entries can't be mutated by a render.
+    params = params or {}
+    key = (chart_id, version, tuple(sorted(params.items())))
+    entry = chart_cache.get(key)
+    if entry is None:
+        frame, *figures = build(**params)
+        with stage("figures.to_json"):
+            entry = (frame, [fig.to_json() for fig in figures])
+        chart_cache.put(key, entry)
+
+    frame, figures_json = entry
+    with stage("figures.from_json"):
+        figures = [pio.from_json(fig_json) for fig_json in figures_json]
+    return (frame, *figures)
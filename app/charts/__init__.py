@@ -0,0 +1,96 @@
+import importlib
+import re
+from collections import namedtuple
+
+from aggregates import with_yield_inputs
+from profiling import stage
+
+# Registry entry for one chart:
+#   title   - label shown in the chart dropdown
+#   module  - module with render_metrics(kpis), compute(cube, **params), figures(frame)
+#             and render(frame, *figures); an optional controls() returns the params and
+#             DOWNLOAD_NAME names the downloaded files
+#   columns - dataset columns the chart reads
+ChartSpec = namedtuple("ChartSpec", ["title", "module", "columns"])
+
+CHARTS = {
+    "chart1": ChartSpec(
+        "Top 7 Rice Producing States", "charts.rice_states",
+        ['State Name', 'RICE PRODUCTION (1000 tons)']),
+    "chart2": ChartSpec(
+        "Top 5 Wheat Producing States and Their Production Percentages (Bar Chart)", "charts.wheat_states",
+        ['State Name', 'WHEAT PRODUCTION (1000 tons)']),
+    "chart3": ChartSpec(
+        "Top 5 States in Oilseed Production", "charts.oilseed_states",
+        ['State Name', 'OILSEEDS PRODUCTION (1000 tons)']),
+    "chart4": ChartSpec(
+        "Top 7 Sunflower Producing States", "charts.sunflower_states",
+        ['State Name', 'SUNFLOWER PRODUCTION (1000 tons)']),
+    "chart5": ChartSpec(
+        "India's Sugarcane Production Over the Last 50 Years", "charts.sugarcane_trend",
+        ['Year', 'SUGARCANE PRODUCTION (1000 tons)']),
+    "chart6": ChartSpec(
+        "Rice vs Wheat Production Over the Last 50 Years", "charts.rice_wheat_trend",
+        ['Year', 'RICE PRODUCTION (1000 tons)', 'WHEAT PRODUCTION (1000 tons)']),
+    "chart7": ChartSpec(
+        "Rice Production in West Bengal by District", "charts.west_bengal_rice",
+        ['State Name', 'Dist Name', 'RICE PRODUCTION (1000 tons)']),
+    "chart8": ChartSpec(
+        "Top 10 Years of Wheat Production in Uttar Pradesh", "charts.up_wheat_years",
+        ['State Name', 'Year', 'WHEAT PRODUCTION (1000 tons)']),
+    "chart9": ChartSpec(
+        "Millet Production Over the Last 50 Years", "charts.millet_trend",
+        ['Year', 'PEARL MILLET PRODUCTION (1000 tons)', 'FINGER MILLET PRODUCTION (1000 tons)']),
+    "chart10": ChartSpec(
+        "Sorghum Production (Kharif and Rabi) by Region", "charts.sorghum_states",
+        ['State Name', 'KHARIF SORGHUM PRODUCTION (1000 tons)', 'RABI SORGHUM PRODUCTION (1000 tons)']),
+    "chart11": ChartSpec(
+        "Top 7 States in Groundnut Production", "charts.groundnut_states",
+        ['State Name', 'GROUNDNUT PRODUCTION (1000 tons)']),
+    "chart12": ChartSpec(
+        "Soybean Production and Yield Efficiency by Top 5 States", "charts.soybean_states",
+        ['State Name', 'SOYABEAN PRODUCTION (1000 tons)', 'SOYABEAN YIELD (Kg per ha)']),
+    "chart13": ChartSpec(
+        "Oilseed Production Across Major States", "charts.oilseed_major_states",
+        ['State Name', 'OILSEEDS PRODUCTION (1000 tons)']),
+    "chart14": ChartSpec(
+        "Impact of Area Cultivated on Rice, Wheat, and Maize Production", "charts.area_yield_scatter",
+        ['RICE AREA (1000 ha)', 'RICE YIELD (Kg per ha)', 'WHEAT AREA (1000 ha)',
+         'WHEAT YIELD (Kg per ha)', 'MAIZE AREA (1000 ha)', 'MAIZE YIELD (Kg per ha)']),
+    "chart15": ChartSpec(
+        "Rice vs Wheat Yield Across States", "charts.rice_wheat_yield",
+        ['State Name', 'RICE YIELD (Kg per ha)', 'WHEAT YIELD (Kg per ha)']),
+}
+
+
+def required_columns(chart_ids=None):
+    # Union of the columns read by the given charts (all charts by default)
+    chart_ids = CHARTS if chart_ids is None else chart_ids
+    columns = [col for chart_id in chart_ids for col in CHARTS[chart_id].columns]
+    # Yields are derived from production and area, so those are read too
+    return sorted(set(with_yield_inputs(columns)))
+
+
+def chart_crops(chart_id):
+    # Crops a chart reads, e.g. "RICE" from "RICE PRODUCTION (1000 tons)"
+    return sorted({re.sub(r" (AREA|PRODUCTION|YIELD) \(.*$", "", col) for col in CHARTS[chart_id].columns})
+
+
+def load_chart(chart_id):
+    # Chart modules are only imported the first time they are selected
+    return importlib.import_module(CHARTS[chart_id].module)
+
+
+def chart_params(chart):
+    # Widgets a chart shows above its figure, returned as compute() keyword arguments
+    return chart.controls() if hasattr(chart, "controls") else {}
+
+
+def build_chart(chart_id, cube, **params):
+    # Frame and figures for one chart, as cached by chart_cache.memoize_chart
+    chart = load_chart(chart_id)
+    with stage(f"{chart_id}.compute"):
+        frame = chart.compute(cube, **params)
+    with stage(f"{chart_id}.figures"):
+        figures = chart.figures(frame)
+    return (frame, *figures)
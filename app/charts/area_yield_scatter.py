@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from metrics import correlation_label
+
+# Grid used by the binned view: at most BINS x BINS points per crop
+BINS = 120
+
+DOWNLOAD_NAME = "Area vs Production (Rice, Wheat, Maize)"
+
+
+def render_metrics(correlations):
+    st.markdown("### 📐 Area vs Production (Rice, Wheat, Maize) – Key Metrics")
+
+    crops = [("🌾 Rice", "RICE"), ("🌿 Wheat", "WHEAT"), ("🌽 Maize", "MAIZE")]
+    for col, (label, crop) in zip(st.columns(3), crops):
+        r = correlations[crop]
+        with col:
+            st.metric(label=label, 
+                  value=f"r = {r:.2f}" if pd.notna(r) else "r = —",
+                  delta=correlation_label(r))
+
+
+def controls():
+    detail = st.radio("Scatter detail", ["Binned", "All points"], horizontal=True,
+                      help="Binned merges nearby districts into one marker sized by count")
+    return {"binned": detail == "Binned"}
+
+
+def bin_points(df, bins=BINS):
+    # Collapse each crop's points onto a bins x bins grid over the plotted range.
+    # One marker per occupied cell (at the cell's mean) keeps the shape of the
+    # distribution, including outliers, while capping the points sent to the browser.
+    if df.empty:
+        return df.assign(Points=0)
+
+    x, y = df['Area'].to_numpy(), df['Yield'].to_numpy()
+    x_span = (np.nanmax(x) - np.nanmin(x)) or 1.0
+    y_span = (np.nanmax(y) - np.nanmin(y)) or 1.0
+    cells = df.assign(
+        x_bin=np.clip(((x - np.nanmin(x)) / x_span * bins).astype(int, copy=False), 0, bins - 1),
+        y_bin=np.clip(((y - np.nanmin(y)) / y_span * bins).astype(int, copy=False), 0, bins - 1),
+    )
+    return (cells.groupby(['Crop', 'x_bin', 'y_bin'], sort=False)
+                 .agg(Area=('Area', 'mean'), Yield=('Yield', 'mean'), Points=('Area', 'size'))
+                 .reset_index()
+                 .drop(columns=['x_bin', 'y_bin']))
+
+
+def compute(cube, binned=True):
+    # Chart 14: Impact of Area Cultivated on Production (Rice, Wheat, Maize)
+    # Create individual dataframes with a "Crop" column (one row per district and year)
+    rows_df = cube.district_rows([
+        'RICE AREA (1000 ha)', 'RICE YIELD (Kg per ha)',
+        'WHEAT AREA (1000 ha)', 'WHEAT YIELD (Kg per ha)',
+        'MAIZE AREA (1000 ha)', 'MAIZE YIELD (Kg per ha)',
+    ])
+    rice_df = rows_df[['RICE AREA (1000 ha)', 'RICE YIELD (Kg per ha)']].copy()
+    rice_df.columns = ['Area', 'Yield']
+    rice_df['Crop'] = 'Rice'
+    
+    wheat_df = rows_df[['WHEAT AREA (1000 ha)', 'WHEAT YIELD (Kg per ha)']].copy()
+    wheat_df.columns = ['Area', 'Yield']
+    wheat_df['Crop'] = 'Wheat'
+    
+    maize_df = rows_df[['MAIZE AREA (1000 ha)', 'MAIZE YIELD (Kg per ha)']].copy()
+    maize_df.columns = ['Area', 'Yield']
+    maize_df['Crop'] = 'Maize'
+    
+    #Combine them
+    
+    combined_df = pd.concat([rice_df, wheat_df, maize_df], ignore_index=True)
+    combined_df = combined_df.dropna(subset=['Area', 'Yield'])
+
+    if binned:
+        combined_df = bin_points(combined_df)
+
+    return combined_df
+
+
+def figures(combined_df):
+    
+    #Create scatter plot (WebGL, binned frames size markers by point count)
+    binned = 'Points' in combined_df
+
+    fig14 = px.scatter(combined_df,
+                 x='Area',
+                 y='Yield',
+                 color='Crop',
+                 size='Points' if binned else None,
+                 size_max=14,
+                 hover_data=['Points'] if binned else None,
+                 render_mode='webgl',
+                 title='Impact of Area Cultivated on Yield for Major Crops',
+                 labels={'Area': 'Area Cultivated (1000 ha)',
+                         'Yield': 'Yield (Kg per ha)'},
+                 color_discrete_map={
+                     'Rice': '#00B4D8',
+                     'Wheat': '#FFB703',
+                     'Maize': '#90E0EF'
+                 })
+    
+    #Styling
+    
+    
+    fig14.update_layout(
+    title_font=dict(color='#FF6F61', size=22),
+    xaxis_title=dict(text='Area Cultivated (1000 ha)', font=dict(color='#999999', size=17)),
+    yaxis_title=dict(text='Yield (Kg per ha)', font=dict(color='#999999', size=17)),
+    template="plotly_dark",
+    legend_title_text='Crop',
+    paper_bgcolor="black",
+    plot_bgcolor="black",
+    shapes=[dict(
+        type="rect", xref="paper", yref="paper",
+        x0=0, y0=0, x1=1, y1=1,
+        line=dict(color="#4d4d4d", width=1), layer="below"
+    )],
+    margin=dict(l=50, r=50, t=80, b=50)
+)
+    
+    fig14.update_layout(height=550)  # control height
+
+    return [fig14]
+
+
+def render(combined_df, fig14):
+    st.plotly_chart(fig14, use_container_width=True)
+
+    # Show data table
+    with st.expander("📄 View Raw Data"):
+        st.dataframe(combined_df)
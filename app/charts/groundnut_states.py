@@ -0,0 +1,60 @@
+import plotly.express as px
+import streamlit as st
+
+from metrics import MEDALS
+
+DOWNLOAD_NAME = "Top 7 States for Groundnut Production"
+
+
+def render_metrics(top):
+    st.markdown("### 🥜 Groundnut Production – Key Metrics")
+
+    for col, medal, (_, row) in zip(st.columns(3), MEDALS, top.iterrows()):
+        with col:
+            st.metric(label=f"{medal} {row['name']}", 
+                  value=f"{row['value']:,.0f} tons", 
+                  delta="↑" if row["diff_prev"] == 0 else f"{row['diff_prev']:,.0f} tons")
+
+
+def compute(cube, top_n=7):
+    # Top 7 States for Groundnut Production
+    q11_df = cube.state_totals('GROUNDNUT PRODUCTION (1000 tons)').sort_values(ascending=False).head(top_n)
+
+    return q11_df
+
+
+def figures(q11_df):
+    fig11 = px.bar(
+        q11_df,
+        x=q11_df.index,
+        y='GROUNDNUT PRODUCTION (1000 tons)',
+        title=f'Top {len(q11_df)} States for Groundnut Production',
+        color=q11_df.index
+    )
+
+    fig11.update_layout(
+        title_font=dict(color='#FF6F61', size=22),
+        xaxis_title=dict(text='State Name', font=dict(color='#999999', size=17)),
+        yaxis_title=dict(text='GROUNDNUT PRODUCTION (1000 tons)', font=dict(color='#999999', size=17)),
+        bargap=0.7,
+        template="plotly_dark",
+        paper_bgcolor="black",
+        plot_bgcolor="black",
+        shapes=[dict(
+            type="rect", xref="paper", yref="paper",
+            x0=0, y0=0, x1=1, y1=1,
+            line=dict(color="#4d4d4d", width=1), layer="below"
+        )],
+        margin=dict(l=50, r=50, t=80, b=50)
+    )
+    fig11.update_layout(height=550)  # control height
+
+    return [fig11]
+
+
+def render(q11_df, fig11):
+    st.plotly_chart(fig11, use_container_width=True)
+
+    # Show data table
+    with st.expander("📄 View Raw Data"):
+        st.dataframe(q11_df)
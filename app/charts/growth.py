@@ -0,0 +1,38 @@
+import plotly.express as px
+
+from analytics import growth_columns
+
+# Shared pieces of the trend charts (5, 6 and 9), drawn from analytics.with_growth() columns
+
+
+def add_rolling_means(fig, frame, columns, x=None):
+    # Dashed rolling-average line next to each plotted measure
+    averages, _ = growth_columns(columns)
+    years = frame.index if x is None else frame[x]
+    for avg in averages:
+        fig.add_scatter(x=years, y=frame[avg], mode="lines", name=avg, line=dict(dash="dash", width=1.5))
+
+
+def yoy_figure(frame, columns, title, x=None):
+    # Year-over-year growth bars of each measure
+    _, yoy = growth_columns(columns)
+    fig = px.bar(frame, x=frame.index if x is None else x, y=yoy, barmode="group", title=title)
+    fig.update_layout(
+        title_font=dict(color='#FF6F61', size=22),
+        xaxis_title=dict(text='Year', font=dict(color='#999999', size=17)),
+        yaxis_title=dict(text='YoY growth (%)', font=dict(color='#999999', size=17)),
+        legend_title_text='Crop',
+        hovermode="x unified",
+        template="plotly_dark",
+        paper_bgcolor="black",
+        plot_bgcolor="black",
+        shapes=[dict(
+            type="rect", xref="paper", yref="paper",
+            x0=0, y0=0, x1=1, y1=1,
+            line=dict(color="#4d4d4d", width=1),
+            layer="below"
+        )],
+        margin=dict(l=50, r=50, t=80, b=50),
+        height=400,
+    )
+    return fig
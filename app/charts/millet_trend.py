@@ -0,0 +1,98 @@
+import plotly.express as px
+import streamlit as st
+
+from analytics import with_growth
+from charts.growth import add_rolling_means, yoy_figure
+
+DOWNLOAD_NAME = "Millet Production (Last 50 Years)"
+
+COLUMNS = ['PEARL MILLET PRODUCTION (1000 tons)', 'FINGER MILLET PRODUCTION (1000 tons)']
+
+
+def render_metrics(peaks):
+    # Millet Production – Key Metrics for Last 50 Years
+    st.markdown("### 🌾 Millet Production – Key Metrics")
+
+    col1, col2 = st.columns(2)
+
+    for col, name, crop in [(col1, "Pearl Millet", "pearl"), (col2, "Finger Millet", "finger")]:
+        peak = peaks[crop]
+        # Comparing against next highest
+        diff = round(peak["value"] - peak["second_value"], 2)
+
+        col.metric(
+        label=f"🌟 Peak {name} – {peak['year']}",
+        value=f"{peak['value'] / 1000:.2f}K Tons",
+        delta=f"↑ {diff / 1000:.2f}K"
+        )
+
+
+def compute(cube):
+    # Millet Production (Last 50 Years)
+    # Growth is computed over the full series so the first plotted years have full windows
+    q9_df = with_growth(cube.year_totals(COLUMNS)).tail(50)
+
+    return q9_df
+
+
+def figures(q9_df):
+    fig9 = px.line(
+        q9_df,
+        x=q9_df.index,
+        y=COLUMNS,
+        title="Millet Production (Last 50 Years)",
+        markers=True
+    )
+
+    fig9.update_layout(
+        title_font=dict(color='#FF6F61', size=22),
+        xaxis_title=dict(text='Year', font=dict(color='#999999', size=17)),
+        yaxis_title=dict(text='Production (1000 tons)', font=dict(color='#999999', size=17)),
+        legend_title_text='Crop',
+        hovermode="x unified",
+        template="plotly_dark",
+        paper_bgcolor="black",
+        plot_bgcolor="black",
+        shapes=[dict(
+            type="rect", xref="paper", yref="paper",
+            x0=0, y0=0, x1=1, y1=1,
+            line=dict(color="#4d4d4d", width=1), layer="below"
+        )],
+        margin=dict(l=50, r=50, t=80, b=50)
+    )
+
+    # Annotate peak Pearl Millet
+    max_year = q9_df['PEARL MILLET PRODUCTION (1000 tons)'].idxmax()
+    max_val = q9_df['PEARL MILLET PRODUCTION (1000 tons)'].max()
+    fig9.add_annotation(
+        x=max_year, y=max_val,
+        text="Peak Pearl Millet", showarrow=True, arrowhead=2,
+        font=dict(color='white'), bgcolor="#333",
+        bordercolor="#666", borderwidth=1,
+    )
+
+    # Annotate peak Finger Millet
+    max_year = q9_df['FINGER MILLET PRODUCTION (1000 tons)'].idxmax()
+    max_val = q9_df['FINGER MILLET PRODUCTION (1000 tons)'].max()
+    fig9.add_annotation(
+        x=max_year, y=max_val,
+        text="Peak Finger Millet", showarrow=True, arrowhead=2,
+        font=dict(color='white'), bgcolor="#333",
+        bordercolor="#666", borderwidth=1,
+    )
+
+    fig9.update_layout(height=550)  # control height
+    add_rolling_means(fig9, q9_df, COLUMNS)
+
+    fig9_yoy = yoy_figure(q9_df, COLUMNS, "Millet Production – Year-over-Year Growth")
+
+    return [fig9, fig9_yoy]
+
+
+def render(q9_df, fig9, fig9_yoy):
+    st.plotly_chart(fig9, use_container_width=True)
+    st.plotly_chart(fig9_yoy, use_container_width=True)
+
+    # Show data table
+    with st.expander("📄 View Raw Data"):
+        st.dataframe(q9_df)
@@ -0,0 +1,63 @@
+import plotly.express as px
+import streamlit as st
+
+DOWNLOAD_NAME = "Oilseed Production in Major States"
+
+
+def render_metrics(top):
+    st.markdown("### 🛢️ Oilseed Major States – Key Metrics")
+
+    names = list(top["name"])
+    for i, (col, medal, (_, row)) in enumerate(zip(st.columns(3), ["🏆", "🥈", "🥉"], top.iterrows())):
+        delta = "↑ Highest Producer" if i == 0 else f"↓ {row['diff_prev']/1000:.1f}K vs {names[i - 1]}"
+        with col:
+            st.metric(label=f"{medal} {row['name']}", 
+                  value=f"{row['value']/1000:.1f}K tons", 
+                  delta=delta)
+
+
+def compute(cube, top_n=5):
+    # Oilseed Production in Major States
+    q13_df = cube.state_totals('OILSEEDS PRODUCTION (1000 tons)').sort_values(ascending=False).head(top_n)
+
+    return q13_df
+
+
+def figures(q13_df):
+    fig13 = px.bar(
+        q13_df,
+        x=q13_df.index,
+        y='OILSEEDS PRODUCTION (1000 tons)',
+        title='Oilseed Production in Major States',
+        color=q13_df.index
+    )
+
+    fig13.update_layout(
+        width=1000,
+        height=600,
+        title_font=dict(color='#FF6F61', size=22),
+        xaxis_title=dict(text='State Name', font=dict(color='#999999', size=17)),
+        yaxis_title=dict(text='OILSEEDS PRODUCTION (1000 tons)', font=dict(color='#999999', size=17)),
+        bargap=0.8,
+        template="plotly_dark",
+        barmode='group',
+        paper_bgcolor="black",
+        plot_bgcolor="black",
+        shapes=[dict(
+            type="rect", xref="paper", yref="paper",
+            x0=0, y0=0, x1=1, y1=1,
+            line=dict(color="#4d4d4d", width=1), layer="below"
+        )],
+        margin=dict(l=50, r=50, t=80, b=50)
+    )
+    fig13.update_layout(height=550)  # control height
+
+    return [fig13]
+
+
+def render(q13_df, fig13):
+    st.plotly_chart(fig13, use_container_width=True)
+
+    # Show data table
+    with st.expander("📄 View Raw Data"):
+        st.dataframe(q13_df)
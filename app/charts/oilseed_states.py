@@ -0,0 +1,59 @@
+import plotly.express as px
+import streamlit as st
+
+from metrics import MEDALS
+
+DOWNLOAD_NAME = "Oilseed Production by Top 5 States"
+
+
+def render_metrics(top):
+    # --- Oilseeds Metrics ---
+    st.markdown("### 🛢️ Oilseed Production – Key Metrics")
+
+    for col, medal, (_, row) in zip(st.columns(3), MEDALS, top.iterrows()):
+        delta = "—" if row["diff_leader"] == 0 else f"↓ {row['diff_leader']/1000:.1f}K Tons"
+        col.metric(f"{medal} {row['name']}", f"{row['value']/1000:.1f}K Tons", delta)
+
+
+def compute(cube, top_n=5):
+    # Oilseed Production by Top 5 States
+    q3_df = cube.state_totals('OILSEEDS PRODUCTION (1000 tons)').sort_values(ascending=False).head(top_n)
+
+    return q3_df
+
+
+def figures(q3_df):
+    fig3 = px.bar(
+        q3_df,
+        x=q3_df.index,
+        y='OILSEEDS PRODUCTION (1000 tons)',
+        title=f'Top {len(q3_df)} Oilseed Producing States',
+        color=q3_df.index
+    )
+    fig3.update_layout(
+        title_font=dict(color='#FF6F61', size=22),
+        xaxis_title=dict(text="State Name", font=dict(color='#999999', size=17)),
+        yaxis_title=dict(text="OILSEEDS PRODUCTION (1000 tons)", font=dict(color='#999999', size=17)),
+        bargap=0.6,
+        template="plotly_dark",
+        paper_bgcolor="black",
+        plot_bgcolor="black",
+        shapes=[dict(
+            type="rect", xref="paper", yref="paper",
+            x0=0, y0=0, x1=1, y1=1,
+            line=dict(color="#4d4d4d", width=1),
+            layer="below"
+        )],
+        margin=dict(l=50, r=50, t=80, b=50)
+    )
+    fig3.update_layout(height=500)  # control height
+
+    return [fig3]
+
+
+def render(q3_df, fig3):
+    st.plotly_chart(fig3, use_container_width=True)
+
+    # Show data table
+    with st.expander("📄 View Raw Data"):
+        st.dataframe(q3_df)
@@ -0,0 +1,60 @@
+import plotly.express as px
+import streamlit as st
+
+from metrics import MEDALS
+
+DOWNLOAD_NAME = "Top_7_Rice_Producing_States"
+
+
+def render_metrics(top):
+    # 💎 Rice Metrics Section
+    st.markdown("### 🌾 Rice Production – Key Metrics")
+
+    # Show metrics with changes from the leader
+    for col, medal, (_, row) in zip(st.columns(3), MEDALS, top.iterrows()):
+        delta = "—" if row["diff_leader"] == 0 else f"↓ {row['diff_leader']/1000:.1f}K Tons"
+        col.metric(f"{medal} {row['name']}", f"{row['value']/1000:.1f}K Tons", delta)
+
+
+def compute(cube, top_n=7):
+    # Top 7 Rice Producing States
+    q1_df = cube.state_totals('RICE PRODUCTION (1000 tons)').sort_values(ascending=False).head(top_n)
+
+    return q1_df
+
+
+def figures(q1_df):
+    fig1 = px.bar(
+        q1_df,
+        x=q1_df.index,
+        y='RICE PRODUCTION (1000 tons)',
+        title=f'Top {len(q1_df)} Rice Producing States',
+        color=q1_df.index
+    )
+    fig1.update_layout(
+        title_font=dict(color='#FF6F61', size=22),
+        xaxis_title=dict(text="State Name", font=dict(color='#999999', size=17)),
+        yaxis_title=dict(text="RICE PRODUCTION (1000 tons)", font=dict(color='#999999', size=17)),
+        bargap=0.5,
+        template="plotly_dark",
+        paper_bgcolor="black",
+        plot_bgcolor="black",
+        shapes=[dict(
+            type="rect", xref="paper", yref="paper",
+            x0=0, y0=0, x1=1, y1=1,
+            line=dict(color="#4d4d4d", width=1),
+            layer="below"
+        )],
+        margin=dict(l=50, r=50, t=80, b=50)
+    )
+    fig1.update_layout(height=500)  # control height
+
+    return [fig1]
+
+
+def render(q1_df, fig1):
+    st.plotly_chart(fig1, use_container_width=True)
+
+    # Show data table
+    with st.expander("📄 View Raw Data"):
+        st.dataframe(q1_df)
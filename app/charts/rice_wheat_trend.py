@@ -0,0 +1,115 @@
+import plotly.express as px
+import streamlit as st
+
+from analytics import with_growth
+from charts.growth import add_rolling_means, yoy_figure
+
+DOWNLOAD_NAME = "Rice Production Vs Wheat Production (Last 50 Years)"
+
+COLUMNS = ['RICE PRODUCTION (1000 tons)', 'WHEAT PRODUCTION (1000 tons)']
+
+
+def render_metrics(peaks):
+    # Key Metrics – Rice & Wheat Production
+    st.markdown("### ⚖️ Rice vs Wheat – Production Metrics")
+
+    col1, col2 = st.columns(2)
+
+    for col, icon, crop in [(col1, "🍚", "rice"), (col2, "🌾", "wheat")]:
+        peak = peaks[crop]
+        if peak["next_year"] is None:
+            delta = "Latest year"
+        else:
+            # Difference from the peak year to the year after
+            diff = round(peak["next_value"] - peak["value"], 2)
+            delta = f"{'↓' if diff < 0 else '↑'} {abs(diff):,.2f} Tons in {peak['next_year']}"
+
+        with col:
+            st.metric(
+            label=f"{icon} {crop.title()} Peak Year - {peak['year']}",
+            value=f"{peak['value']:,.2f} Tons",
+            delta=delta
+        )
+
+
+def compute(cube):
+    # 6. Rice Production Vs Wheat Production (Last 50 Years)
+    # Growth is computed over the full series so the first plotted years have full windows
+    q6_df = with_growth(cube.year_totals(COLUMNS)).tail(50).reset_index()
+
+    return q6_df
+
+
+def figures(q6_df):
+    fig6 = px.line(
+        q6_df,
+        x='Year',
+        y=COLUMNS,
+        title="Rice vs Wheat Production (Last 50 Years)",
+        markers=True
+    )
+
+    fig6.update_layout(
+        title_font=dict(color='#FF6F61', size=22),
+        xaxis_title=dict(text='Year', font=dict(color='#999999', size=17)),
+        yaxis_title=dict(text='Production (1000 tons)', font=dict(color='#999999', size=17)),
+        legend_title_text='Crop',
+        hovermode="x unified",
+        template="plotly_dark",
+        paper_bgcolor="black",
+        plot_bgcolor="black",
+        shapes=[dict(
+            type="rect", xref="paper", yref="paper",
+            x0=0, y0=0, x1=1, y1=1,
+            line=dict(color="#4d4d4d", width=1),
+            layer="below"
+        )],
+        margin=dict(l=50, r=50, t=80, b=50)
+    )
+
+    max_year_rice = q6_df.loc[q6_df['RICE PRODUCTION (1000 tons)'].idxmax(), 'Year']
+    max_val_rice = q6_df['RICE PRODUCTION (1000 tons)'].max()
+
+    fig6.add_annotation(
+        x=max_year_rice,
+        y=max_val_rice,
+        text="Peak Rice",
+        showarrow=True,
+        arrowhead=2,
+        font=dict(color='white'),
+        bgcolor="#333",
+        bordercolor="#666",
+        borderwidth=1
+    )
+
+    max_year_wheat = q6_df.loc[q6_df['WHEAT PRODUCTION (1000 tons)'].idxmax(), 'Year']
+    max_val_wheat = q6_df['WHEAT PRODUCTION (1000 tons)'].max()
+
+    fig6.add_annotation(
+        x=max_year_wheat,
+        y=max_val_wheat,
+        text="Peak Wheat",
+        showarrow=True,
+        arrowhead=2,
+        ax=80,
+        ay=-20,
+        font=dict(color='white'),
+        bgcolor="#333",
+        bordercolor="#666",
+        borderwidth=1
+    )
+    fig6.update_layout(height=550)  # control height
+    add_rolling_means(fig6, q6_df, COLUMNS, x='Year')
+
+    fig6_yoy = yoy_figure(q6_df, COLUMNS, "Rice vs Wheat – Year-over-Year Growth", x='Year')
+
+    return [fig6, fig6_yoy]
+
+
+def render(q6_df, fig6, fig6_yoy):
+    st.plotly_chart(fig6, use_container_width=True)
+    st.plotly_chart(fig6_yoy, use_container_width=True)
+
+    # Show data table
+    with st.expander("📄 View Raw Data"):
+        st.dataframe(q6_df)
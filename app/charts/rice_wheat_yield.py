@@ -0,0 +1,80 @@
+import plotly.express as px
+import streamlit as st
+
+from metrics import MEDALS
+
+DOWNLOAD_NAME = "Rice vs. Wheat Yield Across States"
+
+
+def render_metrics(tops):
+    for crop, heading in [("rice", "### 🌾 Rice Yield – Top States Metrics"),
+                          ("wheat", "### 🌾 Top States by Wheat Yield")]:
+        st.markdown(heading)
+
+        top = tops[crop]
+        names = list(top["name"])
+        for i, (col, (_, row)) in enumerate(zip(st.columns(3), top.iterrows())):
+            delta = f"↑ Highest {crop.title()} Yield" if i == 0 else f"↓ {row['diff_prev']:,.0f} kg/ha vs {names[i - 1]}"
+            with col:
+                st.metric(label=f"{MEDALS[i]} {row['name']}", 
+                      value=f"{row['value']:,.0f} kg/ha", 
+                      delta=delta)
+
+
+def compute(cube):
+    # Chart 15: Rice vs. Wheat Yield Across States (area-weighted per state)
+
+    q15_df = cube.state_totals(
+        ['RICE YIELD (Kg per ha)', 'WHEAT YIELD (Kg per ha)']
+    )
+
+    q15_df['Total_Yield'] = q15_df['RICE YIELD (Kg per ha)'] + q15_df['WHEAT YIELD (Kg per ha)']
+    q15_df = q15_df.sort_values(by='Total_Yield', ascending=False)
+
+    return q15_df
+
+
+def figures(q15_df):
+    q15_df_melted = q15_df.drop(columns='Total_Yield').reset_index().melt(
+        id_vars='State Name', var_name='Crop', value_name='Yield')
+
+    fig15 = px.bar(
+        q15_df_melted,
+        x='State Name',
+        y='Yield',
+        color='Crop',
+        barmode='group',
+        title='Rice vs. Wheat Yield Across States',
+        color_discrete_map={
+            'RICE YIELD (Kg per ha)': '#00B4D8',
+            'WHEAT YIELD (Kg per ha)': '#F9A825'
+        }
+    )
+
+    fig15.update_layout(
+        title_font=dict(color='#FF6F61', size=22),
+        xaxis_title=dict(text='State Name', font=dict(color='#999999', size=17)),
+        yaxis_title=dict(text='Yield (Kg per ha)', font=dict(color='#999999', size=17)),
+        template="plotly_dark",
+        bargap=0.4,
+        paper_bgcolor="black",
+        plot_bgcolor="black",
+        shapes=[dict(
+            type="rect", xref="paper", yref="paper",
+            x0=0, y0=0, x1=1, y1=1,
+            line=dict(color="#4d4d4d", width=1),
+            layer="below"
+        )],
+        margin=dict(l=50, r=50, t=80, b=50)
+    )
+    fig15.update_layout(height=500)  # control height
+
+    return [fig15]
+
+
+def render(q15_df, fig15):
+    st.plotly_chart(fig15, use_container_width=True)
+
+    # Show data table
+    with st.expander("📄 View Raw Data"):
+        st.dataframe(q15_df)
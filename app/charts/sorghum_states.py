@@ -0,0 +1,70 @@
+import plotly.express as px
+import streamlit as st
+
+from metrics import MEDALS
+
+DOWNLOAD_NAME = "Sorghum Production (Kharif and Rabi) by Region"
+
+
+def render_metrics(top):
+    # Show key metrics (Kharif + Rabi totals, difference from top producer)
+    st.markdown("### 🧺 Sorghum Production – Regional Metrics")
+
+    for col, medal, (_, row) in zip(st.columns(3), MEDALS, top.iterrows()):
+        if row["diff_leader"] == 0:
+            col.metric(f"{medal} {row['name']}", f"{row['value']/1000:.2f}K Tons", "—")
+        else:
+            col.metric(f"{medal} {row['name']}", f"{row['value']/1000:.2f}K", f"↓ {row['diff_leader']/1000:.2f}K")
+
+
+def compute(cube):
+    # 10.Sorghum Production (Kharif and Rabi) by Region
+
+    q10_df = cube.state_totals(['KHARIF SORGHUM PRODUCTION (1000 tons)','RABI SORGHUM PRODUCTION (1000 tons)'])
+
+    # Add TOTAL_SORGHUM PRODUCTION (1000 tons)
+    q10_df["TOTAL_SORGHUM PRODUCTION (1000 tons)"] = (
+    q10_df["KHARIF SORGHUM PRODUCTION (1000 tons)"] + q10_df["RABI SORGHUM PRODUCTION (1000 tons)"] )
+    #Sorting TOTAL_SORGHUM PRODUCTION (1000 tons)
+    q10_df = q10_df.sort_values(by="TOTAL_SORGHUM PRODUCTION (1000 tons)", ascending=False)
+
+    return q10_df
+
+
+def figures(q10_df):
+    fig10 = px.bar(q10_df,
+             x=q10_df.index,
+             y='TOTAL_SORGHUM PRODUCTION (1000 tons)',
+             title='Sorghum Production (1000 tons) by State',
+             color=q10_df.index)
+    fig10.update_layout(
+    title_font=dict(color='#FF6F61', size=22),  # Title
+    xaxis_title=dict(text='State Name', font=dict(color='#999999',size=17)),
+    yaxis_title=dict(text='TOTAL_SORGHUM PRODUCTION (1000 tons)', font=dict(color='#999999',size=17)),
+    template="plotly_dark",
+        # Add outer paper background color
+    paper_bgcolor="black",
+    plot_bgcolor="black",
+    
+
+    # Add chart border using shapes
+    shapes=[dict(
+        type="rect",
+        xref="paper", yref="paper",
+        x0=0, y0=0, x1=1, y1=1,
+        line=dict(color="#4d4d4d", width=1),
+        layer="below"
+    )],
+
+    margin=dict(l=50, r=50, t=80, b=50)
+    )
+
+    return [fig10]
+
+
+def render(q10_df, fig10):
+    st.plotly_chart(fig10, use_container_width=True)
+
+    # Show data table
+    with st.expander("📄 View Raw Data"):
+        st.dataframe(q10_df)
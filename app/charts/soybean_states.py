@@ -0,0 +1,62 @@
+import plotly.express as px
+import streamlit as st
+
+DOWNLOAD_NAME = "Soybean Production by Top 5 States and Yield Efficiency"
+
+
+def render_metrics(top):
+    st.markdown("### 🫘 Soybean Production & Yield Metrics")
+
+    for col, icon, (_, row) in zip(st.columns(3), ["🌾", "🌿", "🌱"], top.iterrows()):
+        with col:
+            st.metric(label=f"{icon} {row['name']}", 
+                  value=f"{row['production']/1000:.1f}K tons", 
+                  delta=f"↑ {row['value']:,.0f} kg/ha Yield")
+
+
+def compute(cube, top_n=5):
+    # Soybean Production by Top 5 States and Yield Efficiency (area-weighted yield)
+    q12_df = cube.state_totals(
+        ['SOYABEAN PRODUCTION (1000 tons)', 'SOYABEAN YIELD (Kg per ha)']
+    ).sort_values(by='SOYABEAN YIELD (Kg per ha)', ascending=False).head(top_n)
+
+    return q12_df
+
+
+def figures(q12_df):
+    fig12 = px.bar(
+        q12_df,
+        x=q12_df.index,
+        y=['SOYABEAN PRODUCTION (1000 tons)', 'SOYABEAN YIELD (Kg per ha)'],
+        title=f'Soybean Production by Top {len(q12_df)} States and Yield Efficiency',
+        barmode='group',
+        color_discrete_sequence=['#00B4D8', '#F9A825'],
+        labels={"variable": "Soyabean Production & Yield"}
+    )
+
+    fig12.update_layout(
+        title_font=dict(color='#FF6F61', size=22),
+        xaxis_title=dict(text='State Name', font=dict(color='#999999', size=17)),
+        yaxis_title=dict(text='Production & Yield', font=dict(color='#999999', size=17)),
+        bargap=0.6,
+        template="plotly_dark",
+        paper_bgcolor="black",
+        plot_bgcolor="black",
+        shapes=[dict(
+            type="rect", xref="paper", yref="paper",
+            x0=0, y0=0, x1=1, y1=1,
+            line=dict(color="#4d4d4d", width=1), layer="below"
+        )],
+        margin=dict(l=50, r=50, t=80, b=50),
+        height=500
+    )
+
+    return [fig12]
+
+
+def render(q12_df, fig12):
+    st.plotly_chart(fig12, use_container_width=True)
+
+    # Show data table
+    with st.expander("📄 View Raw Data"):
+        st.dataframe(q12_df)
@@ -0,0 +1,93 @@
+import plotly.express as px
+import streamlit as st
+
+from analytics import with_growth
+from charts.growth import add_rolling_means, yoy_figure
+
+DOWNLOAD_NAME = "sugarcane_production_last_50_years"
+
+
+def render_metrics(peak):
+    # Sugarcane Production – Peak Year Highlight
+    st.markdown("### 🍬 Sugarcane Production – Key Metrics")
+
+    if peak["next_year"] is None:
+        st.metric(f"📅 {peak['year']}", f"{peak['value']:,.2f} Tons", "Latest year")
+        return
+
+    diff = round(peak["next_value"] - peak["value"], 2)  # drop after peak
+    status = "↓" if diff < 0 else "↑"
+
+    # Metric Display
+    st.metric(f"📅 {peak['year']}", f"{peak['value']:,.2f} Tons", f"{status} {abs(diff):,.2f} Tons in {peak['next_year']}")
+
+
+def compute(cube):
+    # 5. India's Sugarcane Production from Last 50 Years (Line Plot)
+    # Growth is computed over the full series so the first plotted years have full windows
+    q5_df = with_growth(cube.year_totals(['SUGARCANE PRODUCTION (1000 tons)'])).reset_index().tail(50)
+
+    return q5_df
+
+
+def figures(q5_df):
+    fig5 = px.line(
+        q5_df,
+        x='Year',
+        y='SUGARCANE PRODUCTION (1000 tons)',
+        title="India's Sugarcane Production (Last 50 Years)",
+        labels={
+            'Year': 'Year',
+            'SUGARCANE PRODUCTION (1000 tons)': 'Production (1000 tons)'
+        },
+        markers=True,
+        color_discrete_sequence=['#00B4D8']
+    )
+
+    fig5.update_layout(
+        title_font=dict(color='#FF6F61', size=22),
+        xaxis_title=dict(text='Year', font=dict(color='#999999', size=17)),
+        yaxis_title=dict(text='Production (1000 tons)', font=dict(color='#999999', size=17)),
+        hovermode="x unified",
+        template="plotly_dark",
+        paper_bgcolor="black",
+        plot_bgcolor="black",
+        shapes=[dict(
+            type="rect", xref="paper", yref="paper",
+            x0=0, y0=0, x1=1, y1=1,
+            line=dict(color="#4d4d4d", width=1),
+            layer="below"
+        )],
+        margin=dict(l=50, r=50, t=80, b=50)
+    )
+
+    max_year = q5_df.loc[q5_df['SUGARCANE PRODUCTION (1000 tons)'].idxmax(), 'Year']
+    max_val = q5_df['SUGARCANE PRODUCTION (1000 tons)'].max()
+
+    fig5.add_annotation(
+        x=max_year,
+        y=max_val,
+        text="Peak Sugarcane",
+        showarrow=True,
+        arrowhead=2,
+        font=dict(color='white'),
+        bgcolor="#333",
+        bordercolor="#666",
+        borderwidth=1
+    )
+    fig5.update_layout(height=550)  # control height
+    add_rolling_means(fig5, q5_df, ['SUGARCANE PRODUCTION (1000 tons)'], x='Year')
+
+    fig5_yoy = yoy_figure(q5_df, ['SUGARCANE PRODUCTION (1000 tons)'],
+                          "Sugarcane Production – Year-over-Year Growth", x='Year')
+
+    return [fig5, fig5_yoy]
+
+
+def render(q5_df, fig5, fig5_yoy):
+    st.plotly_chart(fig5, use_container_width=True)
+    st.plotly_chart(fig5_yoy, use_container_width=True)
+
+    # Show data table
+    with st.expander("📄 View Raw Data"):
+        st.dataframe(q5_df)
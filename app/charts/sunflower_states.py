@@ -0,0 +1,60 @@
+import plotly.express as px
+import streamlit as st
+
+from metrics import MEDALS
+
+DOWNLOAD_NAME = "Top 7 Sunflower Producing States"
+
+
+def render_metrics(top):
+    # 🌻 Sunflower Metrics Section
+    st.markdown("### 🌻 Sunflower Production – Key Metrics")
+
+    # Values (in 1000 tons)
+    for col, medal, (_, row) in zip(st.columns(3), MEDALS, top.iterrows()):
+        delta = "—" if row["diff_leader"] == 0 else f"↓ {row['diff_leader']/1000:.1f}K Tons"
+        col.metric(f"{medal} {row['name']}", f"{row['value']/1000:.1f}K Tons", delta)
+
+
+def compute(cube, top_n=7):
+    # Top 7 Sunflower Producing States
+    q4_df = cube.state_totals('SUNFLOWER PRODUCTION (1000 tons)').sort_values(ascending=False).head(top_n)
+
+    return q4_df
+
+
+def figures(q4_df):
+    fig4 = px.bar(
+        q4_df,
+        x=q4_df.index,
+        y='SUNFLOWER PRODUCTION (1000 tons)',
+        title=f'Top {len(q4_df)} Sunflower Producing States',
+        color=q4_df.index
+    )
+    fig4.update_layout(
+        title_font=dict(color='#FF6F61', size=22),
+        xaxis_title=dict(text="State Name", font=dict(color='#999999', size=17)),
+        yaxis_title=dict(text="SUNFLOWER PRODUCTION (1000 tons)", font=dict(color='#999999', size=17)),
+        bargap=0.5,
+        template="plotly_dark",
+        paper_bgcolor="black",
+        plot_bgcolor="black",
+        shapes=[dict(
+            type="rect", xref="paper", yref="paper",
+            x0=0, y0=0, x1=1, y1=1,
+            line=dict(color="#4d4d4d", width=1),
+            layer="below"
+        )],
+        margin=dict(l=50, r=50, t=80, b=50)
+    )
+    fig4.update_layout(height=500)  # control height
+
+    return [fig4]
+
+
+def render(q4_df, fig4):
+    st.plotly_chart(fig4, use_container_width=True)
+
+    # Show data table
+    with st.expander("📄 View Raw Data"):
+        st.dataframe(q4_df)
@@ -0,0 +1,61 @@
+import plotly.express as px
+import streamlit as st
+
+from metrics import MEDALS
+
+DOWNLOAD_NAME = "Top 10 Wheat Production Years from Uttar Pradesh"
+
+
+def render_metrics(kpis):
+    # Wheat Production Key Metrics of the focus state (Uttar Pradesh by default)
+    st.markdown(f"### 🌽 {kpis['state']} Wheat Production – Yearly Metrics")
+
+    for col, medal, (_, row) in zip(st.columns(3), MEDALS, kpis["top"].iterrows()):
+        delta = "—" if row["diff_leader"] == 0 else f"↓ {row['diff_leader']/1000:.1f}K"
+        col.metric(f"{medal} {row['name']}", f"{row['value']/1000:.1f}K Tons", delta)
+
+
+def compute(cube, state='Uttar Pradesh', top_n=10):
+    # 8. Top 10 Wheat Production Years from Uttar Pradesh (or the selected state)
+    q8_df = cube.year_totals('WHEAT PRODUCTION (1000 tons)', state=state).sort_values(ascending=False).head(top_n)
+    q8_df.attrs["state"] = state
+
+    return q8_df
+
+
+def figures(q8_df):
+    fig8 = px.bar(
+        q8_df,
+        x=q8_df.index,
+        y='WHEAT PRODUCTION (1000 tons)',
+        title=f'Top {len(q8_df)} Wheat Production Years ({q8_df.attrs["state"]})',
+        color=q8_df.index
+    )
+
+    fig8.update_layout(
+        title_font=dict(color='#FF6F61', size=22),
+        xaxis_title=dict(text='Year', font=dict(color='#999999', size=17)),
+        yaxis_title=dict(text='WHEAT PRODUCTION (1000 tons)', font=dict(color='#999999', size=17)),
+        bargap=0.5,
+        template="plotly_dark",
+        paper_bgcolor="black",
+        plot_bgcolor="black",
+        shapes=[dict(
+            type="rect", xref="paper", yref="paper",
+            x0=0, y0=0, x1=1, y1=1,
+            line=dict(color="#4d4d4d", width=1),
+            layer="below"
+        )],
+        margin=dict(l=50, r=50, t=80, b=50)
+    )
+    fig8.update_layout(height=500)  # control height
+
+    return [fig8]
+
+
+def render(q8_df, fig8):
+    st.plotly_chart(fig8, use_container_width=True)
+
+    # Show data table
+    with st.expander("📄 View Raw Data"):
+        st.dataframe(q8_df)
@@ -0,0 +1,65 @@
+import plotly.express as px
+import streamlit as st
+
+from metrics import MEDALS
+
+DOWNLOAD_NAME = "Rice Production by West Bengal Districts"
+
+
+def render_metrics(kpis):
+    # Rice Production by District (Top 5) of the focus state (West Bengal by default)
+    st.markdown(f"### 📍 {kpis['state']} Rice Production – District Metrics")
+
+    col1, col2, col3 = st.columns(3)
+    col4, col5, _ = st.columns(3)
+    for col, medal, (_, row) in zip([col1, col2, col3, col4, col5], MEDALS, kpis["top"].iterrows()):
+        delta = "—" if row["diff_leader"] == 0 else f"↓ {row['diff_leader']/1000:.1f}K"
+        col.metric(f"{medal} {row['name']}", f"{row['value']/1000:.1f}K Tons", delta)
+
+
+def compute(cube, state='West Bengal', top_n=None):
+    # 7. Rice Production by West Bengal (or the selected state's) Districts
+    q7_df = cube.district_totals('RICE PRODUCTION (1000 tons)', state).sort_values(ascending=False)
+    if top_n:
+        q7_df = q7_df.head(top_n)
+    q7_df.attrs["state"] = state
+
+    return q7_df
+
+
+def figures(q7_df):
+    fig7 = px.bar(
+        q7_df,
+        x=q7_df.index,
+        y='RICE PRODUCTION (1000 tons)',
+        title=f'Rice Production by Districts ({q7_df.attrs["state"]})',
+        color=q7_df.index
+    )
+
+    fig7.update_layout(
+        title_font=dict(color='#FF6F61', size=22),
+        xaxis_title=dict(text='District Name', font=dict(color='#999999', size=17)),
+        yaxis_title=dict(text='RICE PRODUCTION (1000 tons)', font=dict(color='#999999', size=17)),
+        bargap=0.5,
+        template="plotly_dark",
+        paper_bgcolor="black",
+        plot_bgcolor="black",
+        shapes=[dict(
+            type="rect", xref="paper", yref="paper",
+            x0=0, y0=0, x1=1, y1=1,
+            line=dict(color="#4d4d4d", width=1),
+            layer="below"
+        )],
+        margin=dict(l=50, r=50, t=80, b=50)
+    )
+    fig7.update_layout(height=500)  # control height
+
+    return [fig7]
+
+
+def render(q7_df, fig7):
+    st.plotly_chart(fig7, use_container_width=True)
+
+    # Show data table
+    with st.expander("📄 View Raw Data"):
+        st.dataframe(q7_df)
@@ -0,0 +1,96 @@
+import plotly.express as px
+import streamlit as st
+
+from metrics import MEDALS
+
+DOWNLOAD_NAME = "Top 5 Wheat Producing States with Bar and Pie Chart"
+
+
+def render_metrics(top):
+    # --- Wheat Metrics ---
+    st.markdown("### 🌽 Wheat Production – Key Metrics")
+
+    for col, medal, (_, row) in zip(st.columns(3), MEDALS, top.iterrows()):
+        delta = "—" if row["diff_leader"] == 0 else f"↓ {row['diff_leader']/1000:.1f}K Tons"
+        col.metric(f"{medal} {row['name']}", f"{row['value']/1000:.1f}K Tons", delta)
+
+
+def compute(cube, top_n=5):
+    # Top 5 Wheat Producing States with Bar and Pie Chart
+    q2_df = cube.state_totals('WHEAT PRODUCTION (1000 tons)') \
+                   .sort_values(ascending=False).head(top_n)
+
+    # Prepare data for Pie Chart
+    q2_df = q2_df.reset_index()
+
+    return q2_df
+
+
+def figures(q2_df):
+    # Bar Chart
+    fig2 = px.bar(
+        q2_df,
+        x='State Name',
+        y='WHEAT PRODUCTION (1000 tons)',
+        title=f'Top {len(q2_df)} Wheat Producing States (Bar Chart)',
+        color='State Name'
+    )
+    fig2.update_layout(
+        title_font=dict(color='#FF6F61', size=22),
+        xaxis_title=dict(text="State Name", font=dict(color='#999999', size=17)),
+        yaxis_title=dict(text="WHEAT PRODUCTION (1000 tons)", font=dict(color='#999999', size=17)),
+        bargap=0.6,
+        template="plotly_dark",
+        paper_bgcolor="black",
+        plot_bgcolor="black",
+        shapes=[dict(
+            type="rect", xref="paper", yref="paper",
+            x0=0, y0=0, x1=1, y1=1,
+            line=dict(color="#4d4d4d", width=1),
+            layer="below"
+        )],
+        margin=dict(l=50, r=50, t=80, b=50),
+        height=500
+    )
+
+    # Pie Chart
+    fig2_1 = px.pie(
+        q2_df,
+        values='WHEAT PRODUCTION (1000 tons)',
+        names='State Name',
+        title=f'Top {len(q2_df)} Wheat Producing States (Pie Chart)',
+        hole=0.3
+    )
+    fig2_1.update_traces(
+        textinfo='percent+label'  # Show percent + label on pie
+    )
+    fig2_1.update_layout(
+        title_font=dict(color='#FF6F61', size=22),
+        template="plotly_dark",
+        paper_bgcolor="black",
+        plot_bgcolor="black",
+        legend_title_text='State Name',
+        shapes=[dict(
+            type="path", xref="paper", yref="paper",
+            x0=1, y0=1, x1=1, y1=1,
+            line=dict(color="#4d4d4d", width=1),
+            layer="below"
+        )],
+        margin=dict(l=50, r=50, t=80, b=50),
+        height=450
+    )
+
+    return [fig2, fig2_1]
+
+
+def render(q2_df, fig2, fig2_1):
+    st.plotly_chart(fig2, use_container_width=True)
+
+    # Pie Chart Section Title
+    st.markdown("### 📊 Wheat Production Share (Pie Chart)")
+
+    st.plotly_chart(fig2_1, use_container_width=True)
+
+    # Show data table
+    with st.expander("📄 View Raw Data"):
+        st.dataframe(q2_df)
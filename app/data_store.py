@@ -0,0 +1,131 @@
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+
+import pandas as pd
+
+from aggregates import AggregateCube
+
+# --- Paths ---
+DATA_DIR = os.environ.get("AGRI_DATA_DIR", "data")
+CSV_PATH = os.path.join(DATA_DIR, "agri_data.csv")
+PARQUET_PATH = os.path.join(DATA_DIR, "agri_data.parquet")
+
+# AGRI_SHARED_DATA=1 keeps the rollups in memory-mapped files under SHARED_DIR,
+# shared read-only by every session and worker process instead of copied
+SHARED = os.environ.get("AGRI_SHARED_DATA", "0") != "0"
+SHARED_DIR = os.path.join(DATA_DIR, "shared")
+
+# Name columns are stored as categoricals, ids as integers, the rest as numbers
+CATEGORY_COLUMNS = ["State Name", "Dist Name"]
+INTEGER_COLUMNS = ["Dist Code", "Year", "State Code"]
+
+# Compact dtypes: ids in the smallest integer type that holds them, measures
+# as float32 (7 significant digits, well above the data's 2 decimals).
+# AGRI_COMPACT_DTYPES=0 keeps int64/float64.
+COMPACT = os.environ.get("AGRI_COMPACT_DTYPES", "1") != "0"
+
+
+def apply_types(df, compact=COMPACT):
+    # Give every column of the cleaned CSV a proper dtype
+    for col in df.columns:
+        if col in CATEGORY_COLUMNS:
+            df[col] = df[col].astype("category")
+        elif col in INTEGER_COLUMNS:
+            values = pd.to_numeric(df[col])
+            df[col] = pd.to_numeric(values, downcast="integer") if compact else values.astype("int64")
+        else:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("float32" if compact else "float64")
+    return df
+
+
+def memory_report(df):
+    # Bytes held by each column, largest first
+    usage = df.memory_usage(deep=True, index=False)
+    return pd.DataFrame({
+        "dtype": df.dtypes.astype(str),
+        "MB": usage / 1e6,
+    }).sort_values("MB", ascending=False)
+
+
+# --- Build Step ---
+def build_store(csv_path=CSV_PATH, out_path=PARQUET_PATH, columns=None):
+    # Convert the cleaned CSV into a typed Parquet file (optionally column-pruned)
+    df = pd.read_csv(csv_path, usecols=columns)
+    df = apply_types(df)
+    df.to_parquet(out_path, index=False)
+    return df
+
+
+def store_is_fresh(csv_path=CSV_PATH, parquet_path=PARQUET_PATH):
+    # Parquet is only used when it exists and is not older than the CSV
+    if not os.path.exists(parquet_path):
+        return False
+    if not os.path.exists(csv_path):
+        return True
+    return os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)
+
+
+def data_version(csv_path=CSV_PATH, parquet_path=PARQUET_PATH):
+    # Changes whenever the file the loader reads from is rewritten
+    path = parquet_path if store_is_fresh(csv_path, parquet_path) else csv_path
+    stat = os.stat(path)
+    return f"{os.path.basename(path)}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+# --- Loader ---
+def load_columns(columns=None, csv_path=CSV_PATH, parquet_path=PARQUET_PATH):
+    # Read only the requested columns, from Parquet when available
+    if store_is_fresh(csv_path, parquet_path):
+        return pd.read_parquet(parquet_path, columns=columns)
+    return apply_types(pd.read_csv(csv_path, usecols=columns))
+
+
+# --- Shared Store ---
+def shared_cube(key, build, directory=SHARED_DIR, keep=2):
+    # Cube for `key` (data version + columns) mapped from `directory`; the first
+    # process that needs it builds and publishes it, the others just map it
+    path = os.path.join(directory, hashlib.sha1(repr(key).encode()).hexdigest()[:16])
+    if not os.path.isdir(path):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        build().save(tmp)
+        try:
+            os.rename(tmp, path)
+        except OSError:
+            # Another worker published it first
+            shutil.rmtree(tmp, ignore_errors=True)
+        prune_shared(directory, keep)
+    return AggregateCube.open(path)
+
+
+def prune_shared(directory=SHARED_DIR, keep=2):
+    # Drop all but the newest `keep` published cubes; processes still mapping
+    # a removed file keep their pages until they let go of it
+    published = [entry for entry in os.scandir(directory) if entry.is_dir() and not entry.name.endswith(".tmp")]
+    published.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in published[keep:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the Parquet data store from the cleaned CSV")
+    parser.add_argument("--csv", default=CSV_PATH)
+    parser.add_argument("--out", default=PARQUET_PATH)
+    parser.add_argument("--columns", nargs="*", help="keep only these columns")
+    parser.add_argument("--report", action="store_true",
+                        help="compare the memory of the raw CSV frame with the typed one instead of building")
+    args = parser.parse_args()
+
+    if args.report:
+        raw = pd.read_csv(args.csv, usecols=args.columns)
+        typed = apply_types(raw.copy(), compact=True)
+        report = memory_report(typed).join(memory_report(raw), rsuffix=" (raw)")
+        print(report.to_string(float_format="{:.2f}".format))
+        raw_mb, typed_mb = report["MB (raw)"].sum(), report["MB"].sum()
+        print(f"Total: {raw_mb:.1f} MB raw -> {typed_mb:.1f} MB typed ({raw_mb / typed_mb:.1f}x smaller)")
+        sys.exit(0)
+
+    df = build_store(args.csv, args.out, args.columns)
+    print(f"Wrote {len(df):,} rows x {len(df.columns)} columns to {args.out}")
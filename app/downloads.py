@@ -0,0 +1,65 @@
+import io
+import os
+
+import pandas as pd
+import streamlit as st
+
+from chart_cache import ChartCache
+
+# Download formats: label -> (file extension, MIME type)
+FORMATS = {
+    "CSV (gzip)": (".csv.gz", "application/gzip"),
+    "Parquet": (".parquet", "application/vnd.apache.parquet"),
+    "Excel": (".xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+
+# Encoded files, shared by every session of the process
+payload_cache = ChartCache(
+    max_entries=int(os.environ.get("AGRI_DOWNLOAD_CACHE_SIZE", "32")),
+    ttl=float(os.environ.get("AGRI_CHART_CACHE_TTL", "3600")),
+)
+
+
+def as_table(frame):
+    # Charts index their frames by state/district/year; keep those as columns
+    if isinstance(frame, pd.Series):
+        frame = frame.to_frame()
+    if not isinstance(frame.index, pd.RangeIndex) or frame.index.name is not None:
+        frame = frame.reset_index()
+    return frame
+
+
+def encode(frame, fmt):
+    # File contents of a chart frame in one of FORMATS
+    table = as_table(frame)
+    buf = io.BytesIO()
+    if fmt == "CSV (gzip)":
+        table.to_csv(buf, index=False, compression={"method": "gzip", "mtime": 0})
+    elif fmt == "Parquet":
+        table.to_parquet(buf, index=False)
+    elif fmt == "Excel":
+        table.to_excel(buf, index=False)
+    else:
+        raise ValueError(f"Unknown download format: {fmt}")
+    return buf.getvalue()
+
+
+def payload(frame, fmt, key):
+    # Encoded once per (chart, data version, params, format)
+    data = payload_cache.get((key, fmt))
+    if data is None:
+        data = encode(frame, fmt)
+        payload_cache.put((key, fmt), data)
+    return data
+
+
+def download_buttons(frame, file_name, key):
+    # One button per format; files are only encoded when a button is clicked
+    for col, (fmt, (ext, mime)) in zip(st.columns(len(FORMATS)), FORMATS.items()):
+        col.download_button(
+            label=f"📥 {fmt}",
+            data=lambda fmt=fmt: payload(frame, fmt, key),
+            file_name=file_name + ext,
+            mime=mime,
+            key=f"download-{fmt}",
+        )
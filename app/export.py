@@ -0,0 +1,206 @@
+import argparse
+import html
+import json
+import logging
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+import parallel_agg
+from aggregates import STATE
+from backends import BACKENDS, DEFAULT_BACKEND
+from charts import CHARTS, build_chart, load_chart
+from downloads import as_table
+from filters import Filters, apply_filters
+from prewarm import default_params
+from sources import data_source
+
+FORMATS = ("html", "json", "png")
+
+# Worker processes rendering charts at once (PNG rendering is CPU bound)
+WORKERS = int(os.environ.get("AGRI_EXPORT_WORKERS", str(os.cpu_count() or 1)))
+
+# plotly.js is written once at the top of the export; pages load it from there
+PLOTLY_JS = "plotly.min.js"
+
+logger = logging.getLogger("agri.export")
+
+# (version, source) snapshot of this process, opened by open_snapshot()
+_snapshot = None
+
+
+def open_snapshot(backend):
+    # Worker initializer: every worker loads the data itself once, as a
+    # session of the app would (AGRI_SHARED_DATA=1 maps the parent's rollups)
+    global _snapshot
+    _snapshot = data_source(backend).current()
+
+
+def start_worker(backend):
+    # Export workers already run one per CPU, so a cube they build is grouped
+    # in-process rather than by a parallel_agg pool of their own
+    parallel_agg.WORKERS = 1
+    open_snapshot(backend)
+
+
+def check_png():
+    # PNGs are rendered by kaleido's local browser (kaleido 1.x drives an
+    # installed Chrome); fail once up front rather than once per chart
+    try:
+        pio.to_image(go.Figure(), format="png")
+    except Exception as exc:
+        reason = " ".join(str(exc).split()).split(". ")[0].rstrip(".") or repr(exc)
+        raise RuntimeError(f"PNG export needs kaleido and a local Chrome/Chromium ({reason})") from None
+
+
+def scope_dir(state):
+    # Folder of one scope: "india" for the whole country, states/<slug> per state
+    if state is None:
+        return "india"
+    return os.path.join("states", re.sub(r"[^a-z0-9]+", "-", state.lower()).strip("-"))
+
+
+def export_chart(chart_id, state, version, out_dir, formats):
+    # Frame and figures of one chart for the whole country or one state,
+    # written in the given formats. Returns the written paths, relative to out_dir.
+    current, source = _snapshot
+    if current != version:
+        raise RuntimeError(f"data changed during the export ({version} -> {current})")
+    filters = Filters(states=(state,)) if state else Filters()
+    chart = load_chart(chart_id)
+    params = default_params(chart, chart_id, filters)
+    frame, *figures = build_chart(chart_id, apply_filters(source, version, filters), **params)
+
+    title = CHARTS[chart_id].title + (f" – {state}" if state else "")
+    directory = os.path.join(out_dir, scope_dir(state))
+    os.makedirs(directory, exist_ok=True)
+    base = os.path.join(directory, chart_id)
+    written = []
+    if "html" in formats:
+        plotly_js = os.path.relpath(os.path.join(out_dir, PLOTLY_JS), directory)
+        with open(base + ".html", "w", encoding="utf-8") as f:
+            f.write(html_page(title, figures, plotly_js))
+        written.append(base + ".html")
+    if "json" in formats:
+        snapshot = {
+            "chart": chart_id,
+            "title": title,
+            "state": state,
+            "version": version,
+            "params": params,
+            "figures": [json.loads(fig.to_json()) for fig in figures],
+            "data": json.loads(as_table(frame).to_json(orient="split", index=False, date_format="iso")),
+        }
+        with open(base + ".json", "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, default=str)
+        written.append(base + ".json")
+    if "png" in formats:
+        # Rendered locally by kaleido; charts with several figures get -2, -3, ...
+        for i, fig in enumerate(figures, start=1):
+            path = base + (f"-{i}" if i > 1 else "") + ".png"
+            fig.write_image(path)
+            written.append(path)
+    return [os.path.relpath(path, out_dir) for path in written]
+
+
+def html_page(title, figures, plotly_js):
+    # Static page of a chart's figures, loading plotly.js from the export itself
+    divs = "\n".join(pio.to_html(fig, full_html=False, include_plotlyjs=False) for fig in figures)
+    return (
+        "<!DOCTYPE html>\n"
+        f'<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>'
+        f'<script src="{plotly_js}"></script></head>\n'
+        f'<body style="background:black">\n{divs}\n</body></html>\n'
+    )
+
+
+def export(backend, out_dir, formats=FORMATS, chart_ids=None, states=(), workers=None):
+    # Every chart (and per state, if given) of the current data snapshot,
+    # rendered by a process pool. Writes manifest.json listing the files and
+    # failures, and returns it.
+    started = time.perf_counter()
+    workers = WORKERS if workers is None else workers
+    chart_ids = list(CHARTS) if chart_ids is None else chart_ids
+    if "png" in formats:
+        check_png()
+
+    open_snapshot(backend)
+    version, _ = _snapshot
+    os.makedirs(out_dir, exist_ok=True)
+    if "html" in formats:
+        with open(os.path.join(out_dir, PLOTLY_JS), "w", encoding="utf-8") as f:
+            f.write(get_plotlyjs())
+
+    tasks = [(chart_id, state) for state in [None, *states] for chart_id in chart_ids]
+    files, errors = {}, {}
+    if workers <= 1:
+        results = []
+        for chart_id, state in tasks:
+            try:
+                results.append(export_chart(chart_id, state, version, out_dir, formats))
+            except Exception as exc:
+                results.append(exc)
+    else:
+        # Spawned, not forked: the data source may hold threads and connections
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=start_worker, initargs=(backend,)) as pool:
+            jobs = [pool.submit(export_chart, chart_id, state, version, out_dir, formats)
+                    for chart_id, state in tasks]
+            results = [job.exception() or job.result() for job in jobs]
+
+    for (chart_id, state), result in zip(tasks, results):
+        scope = state or "India"
+        if isinstance(result, Exception):
+            # A chart with no data for a state is skipped, not fatal
+            errors.setdefault(scope, {})[chart_id] = repr(result)
+            logger.warning("%s (%s) failed: %r", chart_id, scope, result)
+        else:
+            files.setdefault(scope, {})[chart_id] = result
+
+    manifest = {
+        "version": version,
+        "backend": backend,
+        "formats": list(formats),
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "seconds": round(time.perf_counter() - started, 3),
+        "files": files,
+        "errors": errors,
+    }
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, default=str)
+    return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render every chart to static HTML/JSON/PNG snapshots")
+    parser.add_argument("--out", default="exports")
+    parser.add_argument("--backend", choices=BACKENDS, default=DEFAULT_BACKEND)
+    parser.add_argument("--formats", choices=FORMATS, nargs="+", default=["html", "json"],
+                        help="png needs kaleido")
+    parser.add_argument("--charts", choices=list(CHARTS), nargs="+", help="all charts by default")
+    parser.add_argument("--states", nargs="+", default=[], help="also export these states")
+    parser.add_argument("--all-states", action="store_true", help="also export every state")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="charts rendered at once")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    states = args.states
+    if args.all_states:
+        states = sorted(data_source(args.backend).current().source.districts()[STATE].unique())
+    try:
+        manifest = export(args.backend, args.out, args.formats, args.charts, states, args.workers)
+    except RuntimeError as exc:
+        parser.error(str(exc))
+
+    written = sum(len(paths) for scope in manifest["files"].values() for paths in scope.values())
+    failed = sum(len(scope) for scope in manifest["errors"].values())
+    print(f"Wrote {written:,} files for {1 + len(states)} scopes to {args.out} in {manifest['seconds']:.1f}s"
+          + (f" ({failed} charts failed, see manifest.json)" if failed else ""))
+    sys.exit(1 if failed else 0)
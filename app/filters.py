@@ -0,0 +1,80 @@
+import inspect
+import os
+from collections import namedtuple
+
+import streamlit as st
+
+from aggregates import STATE, DISTRICT
+from chart_cache import ChartCache
+
+# Global slice applied to every chart. Empty tuples / None mean "no filter":
+#   states            - names to keep
+#   districts         - (state, district) pairs to keep
+#   years             - (first, last) year, inclusive
+#   crops             - only list the charts about these crops
+#   top_n             - rows shown by the ranking charts (None = each chart's default)
+Filters = namedtuple("Filters", ["states", "districts", "years", "crops", "top_n"],
+                     defaults=[(), (), None, (), None])
+
+# Charts 7 and 8 show a single state: the first selected one, else these
+FOCUS_STATES = {"chart7": "West Bengal", "chart8": "Uttar Pradesh"}
+
+# Filtered cubes/backends, shared by every session of the process
+source_cache = ChartCache(
+    max_entries=int(os.environ.get("AGRI_FILTER_CACHE_SIZE", "16")),
+    ttl=float(os.environ.get("AGRI_CHART_CACHE_TTL", "3600")),
+)
+
+
+def view_key(version, filters):
+    # Cache key of everything computed from a data version and filter set
+    return (version, filters.states, filters.districts, filters.years)
+
+
+def apply_filters(source, version, filters):
+    # Cube or SQL backend restricted to the filters, built once per (version, filters)
+    key = view_key(version, filters)
+    filtered = source_cache.get(key)
+    if filtered is None:
+        filtered = source.filter(filters)
+        source_cache.put(key, filtered)
+    return filtered
+
+
+def focus_state(filters, chart_id):
+    return filters.states[0] if filters.states else FOCUS_STATES[chart_id]
+
+
+def filter_params(chart, chart_id, filters):
+    # compute() keyword arguments a chart takes from the filters
+    accepted = inspect.signature(chart.compute).parameters
+    params = {}
+    if "state" in accepted:
+        params["state"] = focus_state(filters, chart_id)
+    if "top_n" in accepted and filters.top_n:
+        params["top_n"] = filters.top_n
+    return params
+
+
+def sidebar_filters(districts, years, crops):
+    # Filter widgets; `districts` holds the (state, district) pairs of the unfiltered data
+    st.sidebar.markdown("### 🔎 Filters")
+    states = st.sidebar.multiselect("State", sorted(districts[STATE].unique()))
+    if states:
+        districts = districts[districts[STATE].isin(states)]
+    # Options are (state, district) pairs: district names repeat across states
+    pairs = sorted(districts[[STATE, DISTRICT]].itertuples(index=False, name=None), key=lambda pair: pair[::-1])
+    dists = st.sidebar.multiselect("District", pairs, format_func=lambda pair: f"{pair[1]} ({pair[0]})")
+
+    first, last = years
+    year_range = st.sidebar.slider("Years", first, last, (first, last))
+    crop = st.sidebar.multiselect("Crop", crops)
+    top_n = st.sidebar.number_input("Top N (0 = chart default)", min_value=0, max_value=50, value=0)
+
+    return Filters(
+        states=tuple(states),
+        districts=tuple(dists),
+        years=None if year_range == (first, last) else tuple(year_range),
+        crops=tuple(crop),
+        top_n=int(top_n) or None,
+    )
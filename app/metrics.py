@@ -0,0 +1,122 @@
+import os
+
+import pandas as pd
+
+from chart_cache import ChartCache
+
+# KPI cards per data version, filter set and focus states, shared by every session of the process
+metrics_cache = ChartCache(
+    max_entries=int(os.environ.get("AGRI_METRICS_CACHE_SIZE", "16")),
+    ttl=float(os.environ.get("AGRI_CHART_CACHE_TTL", "3600")),
+)
+
+# Medals used for the first three metric cards
+MEDALS = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣"]
+
+
+def leaders(series, n=3):
+    # Top-n rows of a total with the gap to the leader / previous rank and share of the whole
+    top = series.nlargest(n)
+    total = series.sum()
+    return pd.DataFrame({
+        "name": top.index,
+        "value": top.values,
+        "diff_leader": top.iloc[0] - top.values if len(top) else [],
+        "diff_prev": top.diff().fillna(0).values,
+        "share": top.values / total if total else 0.0,
+    })
+
+
+def peak(series):
+    # Peak year of a yearly series, the year after it and the runner-up value
+    series = series.sort_index()
+    peak_year = series.idxmax()
+    after = series[series.index > peak_year]
+    return {
+        "year": peak_year,
+        "value": series[peak_year],
+        "next_year": after.index[0] if len(after) else None,
+        "next_value": after.iloc[0] if len(after) else None,
+        "second_value": series.nlargest(2).iloc[-1],
+    }
+
+
+def correlation_label(r):
+    if pd.isna(r):
+        # Too few (or constant) points in the filtered data
+        return "Not enough data"
+    strength = "Strong" if abs(r) >= 0.9 else "Moderate" if abs(r) >= 0.5 else "Weak"
+    return f"{strength} {'Positive' if r >= 0 else 'Negative'}"
+
+
+# Columns totalled for the KPI cards (yields are area-weighted, see aggregates.rollup)
+STATE_COLUMNS = [
+    'RICE PRODUCTION (1000 tons)', 'WHEAT PRODUCTION (1000 tons)', 'OILSEEDS PRODUCTION (1000 tons)',
+    'SUNFLOWER PRODUCTION (1000 tons)', 'KHARIF SORGHUM PRODUCTION (1000 tons)',
+    'RABI SORGHUM PRODUCTION (1000 tons)', 'GROUNDNUT PRODUCTION (1000 tons)',
+    'SOYABEAN PRODUCTION (1000 tons)', 'SOYABEAN YIELD (Kg per ha)',
+    'RICE YIELD (Kg per ha)', 'WHEAT YIELD (Kg per ha)',
+]
+YEAR_COLUMNS = [
+    'SUGARCANE PRODUCTION (1000 tons)', 'RICE PRODUCTION (1000 tons)', 'WHEAT PRODUCTION (1000 tons)',
+    'PEARL MILLET PRODUCTION (1000 tons)', 'FINGER MILLET PRODUCTION (1000 tons)',
+]
+
+
+def build_metrics(cube, district_state="West Bengal", year_state="Uttar Pradesh"):
+    # Every KPI card of the dashboard from one set of state and year totals.
+    # Works on any backend that answers the AggregateCube calls; the two
+    # states are the ones shown by charts 7 and 8.
+    state_totals = cube.state_totals(STATE_COLUMNS)
+    year_totals = cube.year_totals(YEAR_COLUMNS).tail(50)
+
+    sorghum = (state_totals['KHARIF SORGHUM PRODUCTION (1000 tons)']
+               + state_totals['RABI SORGHUM PRODUCTION (1000 tons)'])
+    state_districts = cube.district_totals('RICE PRODUCTION (1000 tons)', district_state)
+    state_years = cube.year_totals('WHEAT PRODUCTION (1000 tons)', state=year_state)
+
+    # Pearson r of area vs yield at district-year grain
+    correlations = {
+        crop: cube.correlation(f'{crop} AREA (1000 ha)', f'{crop} YIELD (Kg per ha)')
+        for crop in ['RICE', 'WHEAT', 'MAIZE']
+    }
+
+    soybean = leaders(state_totals['SOYABEAN YIELD (Kg per ha)'])
+    soybean["production"] = state_totals['SOYABEAN PRODUCTION (1000 tons)'].reindex(soybean["name"]).values
+
+    return {
+        "chart1": leaders(state_totals['RICE PRODUCTION (1000 tons)']),
+        "chart2": leaders(state_totals['WHEAT PRODUCTION (1000 tons)']),
+        "chart3": leaders(state_totals['OILSEEDS PRODUCTION (1000 tons)']),
+        "chart4": leaders(state_totals['SUNFLOWER PRODUCTION (1000 tons)']),
+        "chart5": peak(year_totals['SUGARCANE PRODUCTION (1000 tons)']),
+        "chart6": {
+            "rice": peak(year_totals['RICE PRODUCTION (1000 tons)']),
+            "wheat": peak(year_totals['WHEAT PRODUCTION (1000 tons)']),
+        },
+        "chart7": {"state": district_state, "top": leaders(state_districts, 5)},
+        "chart8": {"state": year_state, "top": leaders(state_years)},
+        "chart9": {
+            "pearl": peak(year_totals['PEARL MILLET PRODUCTION (1000 tons)']),
+            "finger": peak(year_totals['FINGER MILLET PRODUCTION (1000 tons)']),
+        },
+        "chart10": leaders(sorghum),
+        "chart11": leaders(state_totals['GROUNDNUT PRODUCTION (1000 tons)']),
+        "chart12": soybean,
+        "chart13": leaders(state_totals['OILSEEDS PRODUCTION (1000 tons)']),
+        "chart14": correlations,
+        "chart15": {
+            "rice": leaders(state_totals['RICE YIELD (Kg per ha)']),
+            "wheat": leaders(state_totals['WHEAT YIELD (Kg per ha)']),
+        },
+    }
+
+
+def cached_metrics(view, source, district_state="West Bengal", year_state="Uttar Pradesh"):
+    # build_metrics() once per (view, focus states); `view` is filters.view_key()
+    key = (view, district_state, year_state)
+    metrics = metrics_cache.get(key)
+    if metrics is None:
+        metrics = build_metrics(source, district_state, year_state)
+        metrics_cache.put(key, metrics)
+    return metrics
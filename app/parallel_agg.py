@@ -0,0 +1,226 @@
+import multiprocessing
+import os
+import sys
+import threading
+import types
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+# Worker processes for big aggregations (AGRI_AGG_WORKERS=1 keeps everything
+# in pandas). Frames under MIN_ROWS rows are faster to group in-process than
+# to copy into shared memory.
+WORKERS = int(os.environ.get("AGRI_AGG_WORKERS", str(os.cpu_count() or 1)))
+MIN_ROWS = int(os.environ.get("AGRI_AGG_MIN_ROWS", "1000000"))
+
+HOW = ("sum", "mean", "top")
+
+_pool = None
+_pool_lock = threading.Lock()
+_submit_lock = threading.Lock()
+
+
+def pool():
+    # Process pool shared by every aggregation of the process. Workers are
+    # spawned, not forked: the app runs server and refresh threads.
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+@contextmanager
+def plain_main():
+    # Spawned workers re-import the parent's __main__ module, which under
+    # Streamlit is the page script itself. Workers only need this module, so
+    # they are started (on submit) with an empty __main__ instead.
+    with _submit_lock:
+        main = sys.modules.get("__main__")
+        sys.modules["__main__"] = types.ModuleType("__main__")
+        try:
+            yield
+        finally:
+            sys.modules["__main__"] = main
+
+
+def aggregate(df, keys, columns, how="sum", by=None, n=None, workers=None):
+    # df.groupby(keys)[columns].<how>() over observed groups, where how="top"
+    # gives the n groups with the largest sum of columns[0]. Big frames are
+    # split into contiguous ranges of the `by` key (state, year, ...; keys[0]
+    # by default), aggregated by worker processes over shared memory and merged.
+    if how not in HOW:
+        raise ValueError(f"Unknown aggregation: {how}")
+    by = keys[0] if by is None else by
+    workers = WORKERS if workers is None else workers
+    columns = list(columns)
+    if workers <= 1 or len(df) < MIN_ROWS:
+        return finish(aggregate_frame(df[columns], [df[key] for key in keys], how, n), how, n)
+
+    codes, labels = zip(*(key_codes(df[key]) for key in keys))
+    partition = codes[keys.index(by)] if by in keys else key_codes(df[by])[0]
+    order, ranges = plan(partition, workers)
+    # Groups never span partitions when `by` is a key. Otherwise partials are
+    # re-summed, so a partition can't pick its top groups on its own.
+    disjoint = by in keys
+    part_how = "sum" if how == "top" and not disjoint else how
+
+    # Sums and means come back through an output block: each range writes its
+    # groups (never more than its rows) at its own offset. Top-n partials are
+    # small and simply returned.
+    out_columns = pd.MultiIndex.from_product([["sum", "count"], columns]) if part_how == "mean" else columns
+    out_dtype = "float64" if part_how == "mean" else np.result_type(*df[columns].dtypes)
+    with SharedArray.copy([df[col].to_numpy() for col in columns]) as values, \
+            SharedArray.copy(codes) as key_array, SharedArray.copy([order]) as order_array, \
+            SharedArray.empty((len(out_columns), len(df)), out_dtype) as out, \
+            SharedArray.empty((len(keys), len(df)), "int32") as out_keys:
+        shared = (values.spec, key_array.spec, order_array.spec)
+        output = (out.spec, out_keys.spec) if part_how != "top" else None
+        with plain_main():
+            jobs = [pool().submit(aggregate_part, *shared, output, start, stop, columns, part_how, n)
+                    for start, stop in ranges]
+        parts = [job.result() for job in jobs]
+
+        if output is None:
+            merged = pd.concat(parts)
+            part_codes = index_codes(merged.index, len(keys))
+            merged.index = labeled_index(part_codes, labels, keys)
+        else:
+            spans = [slice(start, start + size) for (start, _), size in zip(ranges, parts)]
+            data = np.concatenate([out.array[:, span] for span in spans], axis=1)
+            part_codes = np.concatenate([out_keys.array[:, span] for span in spans], axis=1)
+            merged = pd.DataFrame(data.T, columns=out_columns, index=labeled_index(part_codes, labels, keys))
+
+    if not disjoint:
+        merged = merged.groupby(level=keys).sum()
+    elif not merged.index.is_monotonic_increasing:
+        merged = merged.sort_index()
+    return finish(merged, how, n)
+
+
+def aggregate_frame(frame, keys, how, n=None):
+    # Partial result of one partition; means are kept as sums and counts until merged
+    grouped = frame.groupby(keys, observed=True)
+    if how == "mean":
+        return pd.concat({"sum": grouped.sum(), "count": grouped.count()}, axis=1)
+    totals = grouped.sum()
+    if how == "top":
+        return totals.nlargest(n, totals.columns[0])
+    return totals
+
+
+def finish(merged, how, n=None):
+    # Final result from (merged) partials
+    if how == "mean":
+        return merged["sum"] / merged["count"]
+    if how == "top":
+        return merged.nlargest(n, merged.columns[0])
+    return merged
+
+
+def aggregate_part(values_spec, keys_spec, order_spec, output, start, stop, columns, how, n):
+    # Worker: aggregate the rows order[start:stop] of the shared arrays. Writes
+    # the groups into the output block at `start` and returns how many, or
+    # returns the partial frame when there is no output block.
+    values, keys, order = (SharedArray.attach(*spec) for spec in (values_spec, keys_spec, order_spec))
+    try:
+        rows = order.array[0, start:stop]
+        # Rows with a missing key (code -1) are left out, as pandas does
+        rows = rows[(keys.array[:, rows] >= 0).all(axis=0)]
+        frame = pd.DataFrame(values.array[:, rows].T, columns=columns)
+        result = aggregate_frame(frame, list(keys.array[:, rows]), how, n)
+    finally:
+        for shared in (values, keys, order):
+            shared.close()
+    if output is None:
+        return result
+
+    out, out_keys = (SharedArray.attach(*spec) for spec in output)
+    try:
+        size = len(result)
+        out.array[:, start:start + size] = result.to_numpy().T
+        out_keys.array[:, start:start + size] = index_codes(result.index, out_keys.array.shape[0])
+    finally:
+        out.close()
+        out_keys.close()
+    return size
+
+
+def key_codes(values):
+    # (integer codes, labels) of a key column; category codes are reused as-is
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy().astype("int32"), values.cat.categories
+    codes, labels = pd.factorize(values, sort=True)
+    return codes.astype("int32"), labels
+
+
+def plan(partition, workers):
+    # Row order grouping each partition value together, and contiguous
+    # (start, stop) ranges of about equal size cut between values
+    order = np.argsort(partition, kind="stable")
+    ordered = partition[order]
+    n = len(ordered)
+    starts = np.r_[0, np.flatnonzero(ordered[1:] != ordered[:-1]) + 1]
+    # A few ranges per worker so one large state doesn't leave the others idle
+    targets = np.arange(1, workers * 2) * n / (workers * 2)
+    cuts = starts[np.minimum(np.searchsorted(starts, targets), len(starts) - 1)]
+    bounds = np.unique(np.r_[0, cuts, n])
+    return order, list(zip(bounds[:-1], bounds[1:]))
+
+
+def index_codes(index, nkeys):
+    # (nkeys, rows) array of the key codes a partial result is indexed by
+    if nkeys == 1:
+        return index.to_numpy()[None, :]
+    return np.vstack([index.get_level_values(i).to_numpy() for i in range(nkeys)])
+
+
+def labeled_index(codes, labels, keys):
+    # Index of the original labels from rows of key codes
+    if len(keys) == 1:
+        return pd.Index(labels[0].take(codes[0]), name=keys[0])
+    return pd.MultiIndex(levels=[pd.Index(level) for level in labels], codes=list(codes),
+                         names=keys, verify_integrity=False)
+
+
+class SharedArray:
+    # A 2-D array (one row per column of data) in a named shared memory block
+
+    def __init__(self, shm, shape, dtype, owner):
+        self.shm = shm
+        self.array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        self.spec = (shm.name, shape, np.dtype(dtype).str)
+        self.owner = owner
+
+    @classmethod
+    def empty(cls, shape, dtype):
+        # New block owned (and unlinked on close) by this process
+        size = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+        return cls(shared_memory.SharedMemory(create=True, size=size), shape, dtype, owner=True)
+
+    @classmethod
+    def copy(cls, columns):
+        shared = cls.empty((len(columns), len(columns[0])), np.result_type(*[col.dtype for col in columns]))
+        for row, col in zip(shared.array, columns):
+            row[:] = col
+        return shared
+
+    @classmethod
+    def attach(cls, name, shape, dtype):
+        return cls(shared_memory.SharedMemory(name=name), shape, dtype, owner=False)
+
+    def close(self):
+        # Views into the block must be gone before it can be closed
+        self.array = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
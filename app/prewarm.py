@@ -0,0 +1,55 @@
+import inspect
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from chart_cache import memoize_chart
+from charts import CHARTS, build_chart, load_chart
+from filters import Filters, filter_params, focus_state, view_key
+from metrics import cached_metrics
+
+# Threads building charts at once; the heavy parts (groupby, numpy) release the GIL
+WORKERS = int(os.environ.get("AGRI_PREWARM_WORKERS", str(min(8, os.cpu_count() or 1))))
+
+logger = logging.getLogger("agri.prewarm")
+
+# Readiness reported by serve.py: ready once a snapshot has been warmed
+status = {"ready": False, "version": None, "charts": 0, "seconds": None, "error": None}
+
+
+def default_params(chart, chart_id, filters=Filters()):
+    # compute() arguments of a page (unfiltered by default) with untouched
+    # widgets, i.e. the params main.py memoizes a first visit under. Widget
+    # values default to compute()'s own defaults.
+    params = filter_params(chart, chart_id, filters)
+    if hasattr(chart, "controls"):
+        for name, param in inspect.signature(chart.compute).parameters.items():
+            if param.default is not param.empty and name not in ("state", "top_n"):
+                params[name] = param.default
+    return params
+
+
+def warm_chart(chart_id, view, source):
+    chart = load_chart(chart_id)
+    memoize_chart(chart_id, view, partial(build_chart, chart_id, source), default_params(chart, chart_id))
+
+
+def warm(snapshot, workers=None):
+    # Fill the process-wide caches for the unfiltered page of a snapshot: the
+    # KPI cards and every chart's frame and figure JSON, built concurrently
+    started = time.perf_counter()
+    filters = Filters()
+    view = view_key(snapshot.version, filters)
+    with ThreadPoolExecutor(max_workers=workers or WORKERS, thread_name_prefix="agri-prewarm") as pool:
+        jobs = [pool.submit(cached_metrics, view, snapshot.source,
+                            focus_state(filters, "chart7"), focus_state(filters, "chart8"))]
+        jobs += [pool.submit(warm_chart, chart_id, view, snapshot.source) for chart_id in CHARTS]
+        for job in jobs:
+            # Re-raises the first failure, which keeps the snapshot from going live
+            job.result()
+
+    seconds = time.perf_counter() - started
+    status.update(ready=True, version=snapshot.version, charts=len(CHARTS), seconds=round(seconds, 3), error=None)
+    logger.info("warmed %d charts of %s in %.2fs", len(CHARTS), snapshot.version, seconds)
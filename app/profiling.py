@@ -0,0 +1,155 @@
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+
+import pandas as pd
+import streamlit as st
+
+# --- Settings (from the environment) ---
+# AGRI_PROFILE=1 profiles every rerun; otherwise only sessions opened with ?profile=1
+ENABLED = os.environ.get("AGRI_PROFILE", "0") != "0"
+# Prometheus textfile (e.g. for node_exporter's textfile collector), rewritten after each rerun
+TEXTFILE = os.environ.get("AGRI_PROFILE_TEXTFILE")
+
+# Histogram buckets in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# One JSON object per line on stderr, ready for a log shipper
+log = logging.getLogger("agri.profile")
+if not log.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(_handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+# Each Streamlit session runs its script on its own thread
+_local = threading.local()
+
+
+class Profiler:
+    # Stage timings of one script run
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages = []
+        self.labels = {}
+        self.elapsed = None
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append((name, time.perf_counter() - started))
+
+    def total(self):
+        # Frozen once the rerun is finished
+        return self.elapsed if self.elapsed is not None else time.perf_counter() - self.started
+
+    def frame(self):
+        # Stage timings in milliseconds, in the order they finished
+        return pd.DataFrame([(name, seconds * 1000) for name, seconds in self.stages], columns=["stage", "ms"])
+
+
+class StageHistogram:
+    # Process-wide duration histogram per stage, in Prometheus exposition format
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self._counts = {}
+        self._sums = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            counts = self._counts.setdefault(stage, [0] * (len(self.buckets) + 1))
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    counts[i] += 1
+            counts[-1] += 1
+            self._sums[stage] = self._sums.get(stage, 0.0) + seconds
+
+    def render(self, name="agri_stage_seconds"):
+        lines = [f"# HELP {name} Duration of dashboard rerun stages.", f"# TYPE {name} histogram"]
+        with self._lock:
+            for stage, counts in sorted(self._counts.items()):
+                for bound, count in zip(self.buckets, counts):
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {count}')
+                lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {counts[-1]}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {self._sums[stage]:.6f}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {counts[-1]}')
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide instance
+histogram = StageHistogram()
+
+
+def start(enabled=False):
+    # Begin profiling this rerun (a no-op unless enabled or AGRI_PROFILE is set)
+    _local.profiler = Profiler() if enabled or ENABLED else None
+    return _local.profiler
+
+
+def current():
+    return getattr(_local, "profiler", None)
+
+
+@contextlib.contextmanager
+def stage(name):
+    # Time a block under `name` when the current rerun is profiled
+    profiler = current()
+    if profiler is None:
+        yield
+        return
+    with profiler.stage(name):
+        yield
+
+
+def finish(**labels):
+    # Record the rerun: histogram, one JSON log line and the optional textfile
+    profiler = current()
+    if profiler is None:
+        return None
+    _local.profiler = None
+
+    profiler.labels = labels
+    profiler.elapsed = total = profiler.total()
+    for name, seconds in profiler.stages:
+        histogram.observe(name, seconds)
+    histogram.observe("rerun", total)
+
+    log.info(json.dumps({
+        "event": "rerun",
+        **labels,
+        "total_ms": round(total * 1000, 2),
+        "stages": {name: round(seconds * 1000, 2) for name, seconds in profiler.stages},
+    }))
+    if TEXTFILE:
+        write_textfile(TEXTFILE)
+    return profiler
+
+
+def write_textfile(path):
+    # Written to a temp file and renamed, so scrapers never see a partial file
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(histogram.render())
+    os.replace(tmp, path)
+
+
+def render_panel(profiler, cache=None, source=None):
+    # Sidebar table of this rerun's stage timings
+    with st.sidebar.expander("⏱️ Profiling", expanded=True):
+        st.caption(f"Rerun total: {profiler.total() * 1000:,.1f} ms")
+        st.dataframe(profiler.frame().style.format({"ms": "{:,.1f}"}), hide_index=True)
+        if cache is not None:
+            st.caption(f"Chart cache: {len(cache)} entries, {cache.hits} hits, {cache.misses} misses")
+        if hasattr(source, "memory_usage"):
+            # Only in-memory sources (not the SQL backend) have a footprint here
+            st.caption(f"Rollups in memory: {source.memory_usage() / 1e6:,.1f} MB")
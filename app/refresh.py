@@ -0,0 +1,97 @@
+import logging
+import os
+import threading
+from collections import namedtuple
+
+# Seconds between data version checks; 0 checks on every rerun instead of in
+# a background thread (the rebuild then runs in the rerun that sees the change)
+INTERVAL = float(os.environ.get("AGRI_REFRESH_INTERVAL", "30"))
+
+logger = logging.getLogger("agri.refresh")
+
+# Data source built for one data version. A rerun reads the snapshot once and
+# uses it throughout, so a swap never mixes two versions in one page.
+Snapshot = namedtuple("Snapshot", ["version", "source"])
+
+
+class SnapshotHolder:
+    # Current snapshot of one data source, rebuilt off the request path when
+    # probe() reports a new version and swapped in with a single assignment.
+    # Sessions keep serving the old snapshot until the new one is complete.
+
+    def __init__(self, probe, build, interval=INTERVAL, on_swap=None, warm=None):
+        self.probe = probe          # () -> data version
+        self.build = build          # version -> cube / backend
+        self.on_swap = on_swap      # snapshot -> None, e.g. to drop caches of the old version
+        self.warm = warm            # snapshot -> None, fills caches before the snapshot goes live
+        self.interval = interval
+        self.swaps = 0
+        self.error = None           # last failed rebuild, kept until one succeeds
+        self._snapshot = None
+        self._build_lock = threading.Lock()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def current(self):
+        # Snapshot to use for this rerun; only the very first call waits for a
+        # build, and requests never wait for a warm-up
+        if self._snapshot is None or self.interval <= 0:
+            self.refresh(warm=False)
+        self.start()
+        return self._snapshot
+
+    def refresh(self, warm=True):
+        # Rebuild (and warm) and swap if the data version changed. Returns True on a swap.
+        with self._build_lock:
+            version = self.probe()
+            if self._snapshot is not None and version == self._snapshot.version:
+                return False
+            snapshot = Snapshot(version, self.build(version))
+            if warm and self.warm is not None:
+                self.warm(snapshot)
+            # A file still being written changes version while we read it;
+            # keep the old snapshot and retry on the next check
+            if self._snapshot is not None and self.probe() != version:
+                return False
+            self._snapshot = snapshot
+            self.swaps += 1
+            self.error = None
+        if self.on_swap is not None:
+            self.on_swap(self._snapshot)
+        logger.info("data version %s is live", version)
+        return True
+
+    def start(self):
+        # Background watcher, one per holder (no-op once running or if disabled)
+        if self.interval <= 0 or self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._watch, name="agri-refresh", daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception as exc:
+                # Keep serving the previous snapshot; the next check retries
+                self.error = exc
+                logger.exception("data refresh failed")
+
+
+_holders = {}
+_lock = threading.Lock()
+
+
+def snapshot_holder(name, probe, build, interval=INTERVAL, on_swap=None, warm=None):
+    # One holder per data source for the whole process, shared by every session
+    with _lock:
+        holder = _holders.get(name)
+        if holder is None:
+            holder = _holders[name] = SnapshotHolder(probe, build, interval, on_swap, warm)
+    return holder
@@ -0,0 +1,83 @@
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import prewarm
+from backends import BACKENDS, DEFAULT_BACKEND
+from refresh import INTERVAL
+from sources import data_source
+
+# Port of the readiness probe for the load balancer
+READY_PORT = int(os.environ.get("AGRI_READY_PORT", "8502"))
+
+logger = logging.getLogger("agri.serve")
+
+
+class ReadinessHandler(BaseHTTPRequestHandler):
+    # GET /ready: 200 once the data and every chart are warm, 503 until then
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/ready":
+            self.send_error(404)
+            return
+        body = json.dumps(prewarm.status, default=str).encode()
+        self.send_response(200 if prewarm.status["ready"] else 503)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Probes arrive every few seconds; keep them out of the log
+        pass
+
+
+def serve_readiness(port=READY_PORT):
+    server = ThreadingHTTPServer(("", port), ReadinessHandler)
+    threading.Thread(target=server.serve_forever, name="agri-ready", daemon=True).start()
+    return server
+
+
+def warm_up(backend, retry=max(INTERVAL, 5)):
+    # Build and warm the first snapshot, then keep it fresh in the background.
+    # Retried until it succeeds; the probe stays at 503 meanwhile.
+    holder = data_source(backend)
+    while True:
+        try:
+            if not holder.refresh():
+                # A page request (e.g. after a failed attempt) built the live
+                # snapshot first; requests never warm, so warm it here
+                prewarm.warm(holder.current())
+            break
+        except Exception as exc:
+            prewarm.status["error"] = repr(exc)
+            logger.exception("prewarm failed, retrying in %ss", retry)
+            time.sleep(retry)
+    holder.start()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run the dashboard with every chart prewarmed and a readiness probe",
+        epilog="Other arguments (e.g. --server.port 8501) are passed to `streamlit run`.")
+    parser.add_argument("--backend", choices=BACKENDS, default=DEFAULT_BACKEND, help="data source to prewarm")
+    parser.add_argument("--ready-port", type=int, default=READY_PORT)
+    parser.add_argument("--workers", type=int, default=prewarm.WORKERS, help="charts built at once")
+    args, streamlit_args = parser.parse_known_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    prewarm.WORKERS = args.workers
+    serve_readiness(args.ready_port)
+    threading.Thread(target=warm_up, args=(args.backend,), name="agri-warm-up", daemon=True).start()
+
+    # Streamlit runs main.py in this process, so the page reads the caches warmed above
+    from streamlit.web import cli
+
+    sys.argv = ["streamlit", "run", os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py"),
+                *streamlit_args]
+    sys.exit(cli.main())
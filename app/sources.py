@@ -0,0 +1,54 @@
+from aggregates import AggregateCube, STATE, DISTRICT, YEAR
+from backends import DuckDbBackend, SqlBackend, sql_version
+from charts import required_columns
+from data_store import CSV_PATH, PARQUET_PATH, SHARED, data_version, load_columns, shared_cube, store_is_fresh
+from db import get_engine
+from filters import source_cache
+from prewarm import warm
+from refresh import snapshot_holder
+
+# Only the columns used by the charts are read from the data store
+COLUMNS = sorted(set(required_columns()) | {STATE, DISTRICT, YEAR})
+
+
+def load_data():
+    return load_columns(COLUMNS)
+
+
+def build_cube(version):
+    # Precomputed state/district x year rollups of one data version
+    if SHARED:
+        # Memory-mapped and handed to every session and worker without a copy
+        return shared_cube((version, COLUMNS), lambda: AggregateCube.build(load_data()))
+    return AggregateCube.build(load_data())
+
+
+def build_sql_backend(version):
+    # Re-probed for the ETL's summary views on every new load
+    return SqlBackend(get_engine())
+
+
+def build_duckdb_backend(version):
+    # Embedded DuckDB over the file the CSV backend would load
+    return DuckDbBackend(PARQUET_PATH if store_is_fresh() else CSV_PATH, COLUMNS)
+
+
+def drop_filtered(snapshot):
+    # Filtered cubes of the retired version would otherwise pin its rollups
+    source_cache.clear()
+
+
+# Per backend: how to read the data version and build a source for it
+SOURCES = {
+    "csv": (data_version, build_cube),
+    "postgres": (lambda: sql_version(get_engine()), build_sql_backend),
+    # Same file as "csv"; its own version keeps the two out of each other's caches
+    "duckdb": (lambda: f"duckdb:{data_version()}", build_duckdb_backend),
+}
+
+
+def data_source(backend):
+    # Process-wide snapshot holder of a backend: rebuilt in the background when
+    # the data version changes, warmed (see prewarm.py), then swapped in
+    probe, build = SOURCES[backend]
+    return snapshot_holder(backend, probe, build, on_swap=drop_filtered, warm=warm)
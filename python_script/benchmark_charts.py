@@ -0,0 +1,145 @@
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+# App modules (data store, cube, charts) live in ../app
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+from data_store import CSV_PATH, apply_types, load_columns
+from aggregates import AggregateCube, DISTRICT, YEAR, STATE, measure_columns
+from metrics import build_metrics
+from charts import CHARTS, load_chart, required_columns
+
+RESULTS_PATH = os.path.join("benchmarks", "results.jsonl")
+
+
+def scale_dataset(df, factor, seed=0):
+    # Grow the dataset `factor` times by adding districts and years.
+    # Copies are spread over ceil(sqrt(factor)) district sets, each further
+    # copy block shifts the years past the real range. Measures get a little
+    # noise so the aggregations are not trivially repeated.
+    if factor == 1:
+        return df
+    rng = np.random.default_rng(seed)
+    district_sets = math.ceil(math.sqrt(factor))
+    years = df[YEAR].max() - df[YEAR].min() + 1
+    measures = measure_columns(df)
+
+    copies = []
+    for i in range(factor):
+        copy = df.copy()
+        district_set, year_block = i % district_sets, i // district_sets
+        if district_set:
+            copy[DISTRICT] = copy[DISTRICT].astype(str) + f" #{district_set}"
+        copy[YEAR] = copy[YEAR] + year_block * years
+        copy[measures] = copy[measures] * rng.lognormal(0, 0.05, size=(len(copy), len(measures)))
+        copies.append(copy)
+    return pd.concat(copies, ignore_index=True)
+
+
+def measure(fn):
+    # Wall time and peak Python/numpy allocation of one call
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = fn()
+    wall = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, wall, peak
+
+
+def run_scale(source, factor, repeat):
+    # Benchmark load, aggregation and every chart at one dataset scale
+    df = scale_dataset(source, factor)
+    columns = sorted(set(required_columns()) | {STATE, DISTRICT, YEAR})
+    rows = []
+
+    def record(stage, fn, payload=None):
+        best = None
+        for _ in range(repeat):
+            result, wall, peak = measure(fn)
+            if best is None or wall < best[0]:
+                best = (wall, peak)
+        size = payload(result) if payload else None
+        rows.append({"scale": factor, "rows": len(df), "stage": stage, "wall_s": round(best[0], 6),
+                     "peak_mb": round(best[1] / 1e6, 3), "payload_bytes": size})
+        return result
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "agri_data.csv")
+        parquet_path = os.path.join(tmp, "agri_data.parquet")
+        df.to_csv(csv_path, index=False)
+        record("load_csv", lambda: load_columns(columns, csv_path, os.path.join(tmp, "missing.parquet")))
+        apply_types(df.copy()).to_parquet(parquet_path, index=False)
+        frame = record("load_parquet", lambda: load_columns(columns, csv_path, parquet_path))
+
+    cube = record("cube", lambda: AggregateCube.build(frame))
+    record("metrics", lambda: build_metrics(cube))
+
+    for chart_id in CHARTS:
+        chart = load_chart(chart_id)
+        record(f"{chart_id}.compute", lambda: chart.compute(cube))
+        result = chart.compute(cube)
+        record(f"{chart_id}.figures", lambda: chart.figures(result),
+               payload=lambda figs: sum(len(fig.to_json()) for fig in figs) + len(result.to_csv()))
+    return rows
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def save_results(rows, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    run = {"commit": git_commit(), "timestamp": datetime.now(timezone.utc).isoformat()}
+    with open(path, "a") as f:
+        for row in rows:
+            f.write(json.dumps({**run, **row}) + "\n")
+
+
+def compare(path, baseline, current):
+    # Wall time of each stage at each scale, current commit vs baseline commit
+    results = pd.read_json(path, lines=True)
+    results = results[results["commit"].isin([baseline, current])]
+    # Latest run of each commit wins
+    results = results.sort_values("timestamp").drop_duplicates(["commit", "scale", "stage"], keep="last")
+    table = results.pivot_table(index=["scale", "stage"], columns="commit", values="wall_s")
+    table["ratio"] = table[current] / table[baseline]
+    return table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark data loading, aggregation and every chart")
+    parser.add_argument("--csv", default=CSV_PATH)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage (best is kept)")
+    parser.add_argument("--out", default=RESULTS_PATH)
+    parser.add_argument("--compare", metavar="COMMIT", help="compare the current commit against COMMIT")
+    args = parser.parse_args()
+
+    if args.compare:
+        print(compare(args.out, args.compare, git_commit()).to_string(float_format="{:.4f}".format))
+        sys.exit(0)
+
+    source = pd.read_csv(args.csv)
+    all_rows = []
+    for factor in args.scales:
+        rows = run_scale(source, factor, args.repeat)
+        all_rows.extend(rows)
+        print(pd.DataFrame(rows).drop(columns="scale").to_string(index=False))
+
+    save_results(all_rows, args.out)
+    print(f"Results appended to {args.out}")
@@ -0,0 +1,234 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# App modules (data store) live in ../app
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+from data_store import CSV_PATH, PARQUET_PATH, apply_types
+
+# --- Schema (same column order as the ICRISAT district-level agri_data.csv) ---
+ID_COLUMNS = ["Dist Code", "Year", "State Code", "State Name", "Dist Name"]
+
+# Crop: (mean district area in 1000 ha, 1966 yield in kg/ha, yearly yield growth, share of districts growing it)
+CROPS = {
+    "RICE": (80, 1000, 0.020, 0.90),
+    "WHEAT": (60, 900, 0.025, 0.75),
+    "KHARIF SORGHUM": (25, 500, 0.010, 0.55),
+    "RABI SORGHUM": (30, 450, 0.010, 0.35),
+    "PEARL MILLET": (30, 400, 0.020, 0.50),
+    "MAIZE": (20, 1000, 0.025, 0.80),
+    "FINGER MILLET": (10, 700, 0.010, 0.35),
+    "BARLEY": (5, 800, 0.015, 0.45),
+    "CHICKPEA": (20, 600, 0.010, 0.75),
+    "PIGEONPEA": (10, 700, 0.005, 0.70),
+    "MINOR PULSES": (25, 400, 0.005, 0.85),
+    "GROUNDNUT": (20, 750, 0.010, 0.65),
+    "SESAMUM": (5, 250, 0.010, 0.70),
+    "RAPESEED AND MUSTARD": (10, 500, 0.015, 0.70),
+    "SAFFLOWER": (3, 450, 0.005, 0.20),
+    "CASTOR": (3, 400, 0.020, 0.25),
+    "LINSEED": (4, 300, 0.005, 0.45),
+    "SUNFLOWER": (3, 550, 0.010, 0.35),
+    "SOYABEAN": (15, 700, 0.020, 0.35),
+    "SUGARCANE": (12, 45000, 0.010, 0.70),
+    "COTTON": (25, 150, 0.020, 0.45),
+}
+OILSEEDS = ["GROUNDNUT", "SESAMUM", "RAPESEED AND MUSTARD", "SAFFLOWER", "CASTOR", "LINSEED",
+            "SUNFLOWER", "SOYABEAN"]
+
+# Crops reported with area only: (mean district area in 1000 ha, share of districts growing it)
+AREA_ONLY = {
+    "FRUITS": (5, 0.90),
+    "VEGETABLES": (8, 0.95),
+    "POTATOES": (3, 0.70),
+    "ONION": (2, 0.60),
+    "FODDER": (10, 0.60),
+}
+
+STATES = [
+    "Chhattisgarh", "Madhya Pradesh", "Tamil Nadu", "Bihar", "Orissa", "West Bengal", "Uttar Pradesh",
+    "Andhra Pradesh", "Karnataka", "Gujarat", "Maharashtra", "Rajasthan", "Punjab", "Haryana",
+    "Uttarakhand", "Jharkhand", "Himachal Pradesh", "Telangana", "Kerala", "Assam",
+]
+
+
+def area(crop):
+    return f"{crop} AREA (1000 ha)"
+
+
+def production(crop):
+    return f"{crop} PRODUCTION (1000 tons)"
+
+
+def crop_yield(crop):
+    return f"{crop} YIELD (Kg per ha)"
+
+
+def schema_columns():
+    # The ~80 columns of agri_data.csv in file order
+    crops = list(CROPS)
+    crops.insert(crops.index("PEARL MILLET"), "SORGHUM")
+    crops.insert(crops.index("SUGARCANE"), "OILSEEDS")
+    columns = list(ID_COLUMNS)
+    for crop in crops:
+        columns += [area(crop), production(crop), crop_yield(crop)]
+    for crop in ["FRUITS", "VEGETABLES", "FRUITS AND VEGETABLES", "POTATOES", "ONION", "FODDER"]:
+        columns.append(area(crop))
+    return columns
+
+
+# --- District Profiles ---
+class DistrictProfiles:
+    # Fixed per-district characteristics; every year is drawn around them.
+    # States favour some crops over others, districts vary in size and in
+    # which crops they grow at all.
+
+    def __init__(self, states, districts, seed=0):
+        self.rng = np.random.default_rng(seed)
+        names = STATES[:states] + [f"State {i + 1}" for i in range(len(STATES), states)]
+        n = states * districts
+
+        self.state_code = np.repeat(np.arange(1, states + 1), districts)
+        self.state_name = np.repeat(names, districts)
+        self.dist_code = np.arange(1, n + 1)
+        self.dist_name = np.array([f"{name} District {i % districts + 1}"
+                                   for i, name in enumerate(self.state_name)])
+
+        self.crops = list(CROPS) + list(AREA_ONLY)
+        mean_area = np.array([CROPS[c][0] for c in CROPS] + [AREA_ONLY[c][0] for c in AREA_ONLY])
+        prevalence = np.array([CROPS[c][3] for c in CROPS] + [AREA_ONLY[c][1] for c in AREA_ONLY])
+
+        # State affinity for each crop (e.g. rice-heavy east, wheat-heavy north)
+        affinity = self.rng.lognormal(0, 0.8, size=(states, len(self.crops)))[self.state_code - 1]
+        grown = self.rng.random((n, len(self.crops))) < np.clip(prevalence * affinity, 0, 1)
+        size = self.rng.lognormal(0, 0.5, size=(n, 1))
+        self.base_area = grown * mean_area * affinity * size * self.rng.lognormal(0, 0.4, (n, len(self.crops)))
+
+        # Yield level per state and district for the crops with production data
+        yields = len(CROPS)
+        state_level = self.rng.lognormal(0, 0.2, size=(states, yields))[self.state_code - 1]
+        self.base_yield = (np.array([CROPS[c][1] for c in CROPS]) * state_level
+                           * self.rng.lognormal(0, 0.1, size=(n, yields)))
+        self.growth = np.array([CROPS[c][2] for c in CROPS])
+
+    def __len__(self):
+        return len(self.dist_code)
+
+    def year(self, year, first_year):
+        # One row per district for a single year
+        n, t = len(self), year - first_year
+        rng = self.rng
+        # Statewide weather shock shared by all crops of a state, plus local noise
+        shock = rng.lognormal(0, 0.08, size=self.state_code.max())[self.state_code - 1][:, None]
+
+        areas = self.base_area * rng.lognormal(0, 0.1, self.base_area.shape)
+        yields = (self.base_yield * (1 + self.growth) ** t * shock
+                  * rng.lognormal(0, 0.12, self.base_yield.shape))
+        yields[areas[:, :len(CROPS)] == 0] = 0
+
+        columns = {
+            "Dist Code": self.dist_code, "Year": np.full(n, year), "State Code": self.state_code,
+            "State Name": self.state_name, "Dist Name": self.dist_name,
+        }
+        for i, crop in enumerate(self.crops):
+            columns[area(crop)] = areas[:, i]
+            if crop in CROPS:
+                columns[production(crop)] = areas[:, i] * yields[:, i] / 1000
+                columns[crop_yield(crop)] = yields[:, i]
+        frame = pd.DataFrame(columns)
+
+        # Aggregate crops are the sums of their parts, with yield = production / area
+        for total, parts in [("SORGHUM", ["KHARIF SORGHUM", "RABI SORGHUM"]), ("OILSEEDS", OILSEEDS)]:
+            frame[area(total)] = frame[[area(c) for c in parts]].sum(axis=1)
+            frame[production(total)] = frame[[production(c) for c in parts]].sum(axis=1)
+            frame[crop_yield(total)] = (frame[production(total)] * 1000
+                                        / frame[area(total)].where(frame[area(total)] > 0)).fillna(0)
+        frame[area("FRUITS AND VEGETABLES")] = frame[area("FRUITS")] + frame[area("VEGETABLES")]
+        return frame[schema_columns()].round(2)
+
+
+def generate(states=20, districts=15, first_year=1966, years=52, chunk_years=10, seed=0):
+    # Yields DataFrames of `chunk_years` years each, so memory stays bounded
+    profiles = DistrictProfiles(states, districts, seed)
+    for start in range(first_year, first_year + years, chunk_years):
+        stop = min(start + chunk_years, first_year + years)
+        yield pd.concat([profiles.year(year, first_year) for year in range(start, stop)], ignore_index=True)
+
+
+# --- Writers ---
+def write_csv(chunks, path):
+    rows = 0
+    for i, chunk in enumerate(chunks):
+        chunk.to_csv(path, index=False, mode="w" if i == 0 else "a", header=i == 0)
+        rows += len(chunk)
+    return rows
+
+
+def write_parquet(chunks, path):
+    # Typed like data_store.build_store; written one row group per chunk
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    rows = 0
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(apply_types(chunk), preserve_index=False)
+            if writer is None:
+                # Every chunk holds the same districts, so the first schema fits all
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def write_postgres(chunks, chunk_size=50_000, batch_chunks=10):
+    # Goes through the ETL's full load (chunked COPY, natural key, summary views)
+    from agri_etl_postgres import (TABLE, build_summaries, ensure_watermark_table, file_hash,
+                                   full_load, get_engine, touch_watermark)
+
+    engine = get_engine()
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "agri_data.csv")
+        write_csv(chunks, csv_path)
+        ensure_watermark_table(engine)
+        rows = full_load(engine, csv_path, file_hash(csv_path), chunk_size, batch_chunks)
+    build_summaries(engine)
+    touch_watermark(engine)
+    print(f"  loaded into {TABLE}")
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic dataset with the agri_data schema")
+    parser.add_argument("--states", type=int, default=20)
+    parser.add_argument("--districts", type=int, default=15, help="districts per state")
+    parser.add_argument("--first-year", type=int, default=1966)
+    parser.add_argument("--years", type=int, default=52)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-years", type=int, default=10, help="years generated per chunk")
+    parser.add_argument("--format", choices=["csv", "parquet", "postgres"], default="csv")
+    parser.add_argument("--out", help="output file (default: data/agri_data.csv or .parquet)")
+    args = parser.parse_args()
+
+    started = time.monotonic()
+    chunks = generate(args.states, args.districts, args.first_year, args.years, args.chunk_years, args.seed)
+    if args.format == "csv":
+        target = args.out or CSV_PATH
+        rows = write_csv(chunks, target)
+    elif args.format == "parquet":
+        target = args.out or PARQUET_PATH
+        rows = write_parquet(chunks, target)
+    else:
+        target = "PostgreSQL"
+        rows = write_postgres(chunks)
+    print(f"Wrote {rows:,} rows x {len(schema_columns())} columns to {target} "
+          f"in {time.monotonic() - started:.1f}s")